@@ -7,6 +7,7 @@ class Config:
     CAMERA_HEIGHT = 480
     CAMERA_INDEX = 0
     CAMERA_FPS = 30  # NUEVO: Limitar FPS para mejor procesamiento
+    CAMERA_FOURCC = 'MJPG'  # NUEVO: MJPG permite 30 FPS donde YUY2 se queda en ~15
     
     # ========== CONFIGURACIÓN DE DETECCIÓN (OPTIMIZADA) ==========
     MAX_NUM_HANDS = 2
@@ -15,6 +16,14 @@ class Config:
     MIN_DETECTION_CONFIDENCE = 0.6  # Reducido de 0.7 a 0.6
     MIN_TRACKING_CONFIDENCE = 0.5   # Mantener en 0.5
     
+    # NUEVO: Modo video de MediaPipe - reutiliza los landmarks del frame anterior
+    # y solo ejecuta el detector de palma cuando el tracking cae bajo el umbral
+    TRACKING_MODE = True
+    
+    # NUEVO: Ancho máximo del frame que recibe MediaPipe (el alto conserva la
+    # proporción). La imagen mostrada sigue usando la resolución de la cámara.
+    INFERENCE_WIDTH = 320
+    
     # NUEVO: Parámetros de velocidad
     FAST_MODE = True  # Activar modo rápido por defecto
     SMOOTHING_ENABLED = True  # Suavizado mínimo
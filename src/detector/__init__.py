@@ -3,13 +3,27 @@
 Módulo de detección de manos y clasificación de gestos
 """
 
-from .hand_detector import HandDetector
-from .gesture_classifier import GestureClassifier
-from .syllable_classifier import SyllableClassifier
-from .advanced_hand_detector import AdvancedHandDetector
-from .gesture_calibrator import GestureCalibrator
-from .gesture_controls import GestureControls
-from .complete_word_detector import CompleteWordDetector
+import importlib
+
+# Los submódulos se importan al primer acceso: los detectores de manos
+# cargan MediaPipe, que no hace falta para usar solo los clasificadores
+_LAZY_IMPORTS = {
+    'HandDetector': '.hand_detector',
+    'GestureClassifier': '.gesture_classifier',
+    'SyllableClassifier': '.syllable_classifier',
+    'AdvancedHandDetector': '.advanced_hand_detector',
+    'GestureCalibrator': '.gesture_calibrator',
+    'GestureControls': '.gesture_controls',
+    'CompleteWordDetector': '.complete_word_detector',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'HandDetector', 
@@ -19,4 +33,4 @@ __all__ = [
     'GestureCalibrator',
     'GestureControls',
     'CompleteWordDetector'
-]
\ No newline at end of file
+]
@@ -11,21 +11,24 @@ class AdvancedHandDetector:
     def __init__(self, 
                  max_num_hands: int = 2,
                  min_detection_confidence: float = 0.65,  # BALANCEADO: velocidad + precisión
-                 min_tracking_confidence: float = 0.55):   # BALANCEADO
+                 min_tracking_confidence: float = 0.55,   # BALANCEADO
+                 static_image_mode: bool = False,         # False = modo video con tracking
+                 inference_width: Optional[int] = None):  # Ancho máximo para MediaPipe
         
         # Inicializar MediaPipe con configuración BALANCEADA
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.static_image_mode = static_image_mode
+        self.inference_width = inference_width
+        self._inference_buffer = None
+        
         # Configurar el detector BALANCEADO
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_num_hands,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence,
-            model_complexity=0  # 0 = rápido (mantener)
-        )
+        self.hands = self._create_hands()
         
         # Sistema de filtrado temporal OPTIMIZADO
         self.landmarks_history = {
@@ -49,23 +52,54 @@ class AdvancedHandDetector:
             'right': deque(maxlen=10)
         }
         
+    def _create_hands(self):
+        """Crea la instancia de MediaPipe Hands con la configuración actual"""
+        return self.mp_hands.Hands(
+            static_image_mode=self.static_image_mode,
+            max_num_hands=self.max_num_hands,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence,
+            model_complexity=0  # 0 = rápido (mantener)
+        )
+    
+    def _resize_for_inference(self, frame: np.ndarray) -> np.ndarray:
+        """Reduce el frame al ancho de inferencia conservando la proporción"""
+        height, width = frame.shape[:2]
+        if not self.inference_width or width <= self.inference_width:
+            return frame
+        
+        scale = self.inference_width / width
+        shape = (int(round(height * scale)), self.inference_width) + frame.shape[2:]
+        # El frame reducido solo vive hasta el cvtColor: se reutiliza el mismo buffer
+        if self._inference_buffer is None or self._inference_buffer.shape != shape:
+            self._inference_buffer = np.empty(shape, dtype=frame.dtype)
+        return cv2.resize(
+            frame,
+            (shape[1], shape[0]),
+            dst=self._inference_buffer,
+            interpolation=cv2.INTER_AREA
+        )
+    
+    def preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Ajuste de iluminación que recibe todo frame antes de detectar o mostrarse"""
+        return self.lighting_adapter.enhance_frame_fast(frame)
+    
     def detect_hands(self, frame: np.ndarray) -> Tuple[np.ndarray, Dict]:
         """
         Detección BALANCEADA: rápida y precisa
         """
         # 1. Preprocesamiento OPTIMIZADO
-        enhanced_frame = self.lighting_adapter.enhance_frame_fast(frame)  # CORREGIDO
+        enhanced_frame = self.preprocess_frame(frame)  # CORREGIDO
         
-        # 2. Convertir a RGB para MediaPipe
-        rgb_frame = cv2.cvtColor(enhanced_frame, cv2.COLOR_BGR2RGB)
+        # 2. Convertir a RGB para MediaPipe (reducido: los landmarks son normalizados)
+        rgb_frame = cv2.cvtColor(self._resize_for_inference(enhanced_frame), cv2.COLOR_BGR2RGB)
         rgb_frame.flags.writeable = False
         
         # 3. Procesar con MediaPipe
         results = self.hands.process(rgb_frame)
         
-        # 4. Convertir de vuelta a BGR
-        rgb_frame.flags.writeable = True
-        processed_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
+        # 4. Dibujar sobre el frame a resolución completa
+        processed_frame = enhanced_frame.copy()
         
         # 5. Procesar resultados con validación mejorada
         hands_data = self._process_detection_results_enhanced(results, processed_frame)
@@ -675,9 +709,10 @@ class LightingAdapter:
     
     def enhance_frame_fast(self, frame):
         """Mejora el frame con procesamiento MÍNIMO"""
-        # Procesamiento ligero - solo ajuste de brillo si es necesario
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        mean_brightness = np.mean(gray)
+        # Procesamiento ligero - solo ajuste de brillo si es necesario.
+        # El brillo medio se estima sobre una muestra 1/4: basta para los umbrales
+        sample = cv2.resize(frame, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_NEAREST)
+        mean_brightness = np.mean(cv2.cvtColor(sample, cv2.COLOR_BGR2GRAY))
         
         # Solo ajustar si está muy oscuro o muy claro
         if mean_brightness < 60:  # Muy oscuro
@@ -4,9 +4,13 @@ Detector de palabras completas por gestos únicos
 CON DESCRIPCIONES DE GESTOS REALES
 """
 
+import logging
 import numpy as np
+from collections import deque
 from typing import Optional, Dict, List, Tuple
 
+logger = logging.getLogger(__name__)
+
 class CompleteWordDetector:
     def __init__(self):
         # Mapeo de gestos únicos a palabras completas
@@ -143,9 +147,9 @@ class CompleteWordDetector:
             'FRIEND_LINK': ('🤝', 'Manos estrechándose'),
         }
         
-        # Historial de detección
-        self.detection_history = []
+        # Historial de detección: ventana deslizante de los últimos frames
         self.stability_threshold = 8
+        self.detection_history = deque(maxlen=self.stability_threshold)
         self.last_detected_word = None
         self.cooldown_frames = 0
         self.cooldown_threshold = 30
@@ -177,7 +181,9 @@ class CompleteWordDetector:
                 else:
                     return None
             elif isinstance(landmarks, np.ndarray):
-                if landmarks.size >= 63:
+                if landmarks.shape == (21, 3):
+                    landmarks_array = landmarks
+                elif landmarks.size >= 63:
                     landmarks_array = landmarks.flatten()[:63].reshape(-1, 3)
                 elif landmarks.shape[0] >= 21 and landmarks.shape[1] == 3:
                     landmarks_array = landmarks[:21]
@@ -186,7 +192,7 @@ class CompleteWordDetector:
             else:
                 return None
         except Exception as e:
-            print(f"Error procesando landmarks: {e}")
+            logger.error("Error procesando landmarks: %s", e)
             return None
         
         # Enfriar después de detección
@@ -198,19 +204,13 @@ class CompleteWordDetector:
         gesture_type = self._classify_word_gesture(landmarks_array)
         
         if gesture_type:
-            # Agregar a historial
+            # Agregar a historial (la ventana descarta sola los frames viejos)
             self.detection_history.append(gesture_type)
             
-            # Mantener solo últimos frames
-            if len(self.detection_history) > self.stability_threshold:
-                self.detection_history = self.detection_history[-self.stability_threshold:]
-            
-            # Verificar estabilidad
+            # Verificar estabilidad cuando la ventana está llena
             if len(self.detection_history) >= self.stability_threshold:
-                recent = self.detection_history[-self.stability_threshold:]
-                
                 # Contar ocurrencias del gesto actual
-                gesture_count = sum(1 for g in recent if g == gesture_type)
+                gesture_count = self.detection_history.count(gesture_type)
                 
                 # Si es consistente (70% de frames)
                 if gesture_count >= self.stability_threshold * 0.7:
@@ -227,7 +227,7 @@ class CompleteWordDetector:
                         # Limpiar historial
                         self.detection_history.clear()
                         
-                        print(f"[PALABRA COMPLETA] ⚡ Detectada: {word} (gesto: {gesture_type})")
+                        logger.info("Palabra completa detectada: %s (gesto: %s)", word, gesture_type)
                         return word
         
         return None
@@ -389,7 +389,7 @@ class CompleteWordDetector:
             return None
             
         except Exception as e:
-            print(f"Error clasificando gesto: {e}")
+            logger.error("Error clasificando gesto: %s", e)
             return None
     
     def _register_usage(self, word: str):
@@ -418,6 +418,10 @@ class CompleteWordDetector:
             return True
         return False
     
+    def hand_lost(self):
+        """Descarta el gesto a medio formar cuando la mano sale de escena"""
+        self.detection_history.clear()
+    
     def reset_detection(self):
         """Resetea el estado de detección"""
         self.detection_history.clear()
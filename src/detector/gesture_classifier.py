@@ -1,11 +1,33 @@
 # src/detector/gesture_classifier_improved.py
 # VERSIÓN CON MÁXIMA PRECISIÓN PARA TODAS LAS LETRAS
 
+import logging
 import numpy as np
 import cv2
 from typing import List, Optional, Dict, Any, Union
 
+logger = logging.getLogger(__name__)
+
 class GestureClassifier:
+    # Tríos (p1, vértice, p3) de los ángulos que se extraen por frame
+    _ANGLE_NAMES = (
+        'thumb_angle', 'index_angle', 'middle_angle', 'ring_angle', 'pinky_angle',
+        'index_middle_angle', 'middle_ring_angle', 'thumb_index_angle'
+    )
+    _ANGLE_A = np.array([2, 5, 9, 13, 17, 8, 12, 4])
+    _ANGLE_B = np.array([3, 6, 10, 14, 18, 5, 9, 0])
+    _ANGLE_C = np.array([4, 8, 12, 16, 20, 12, 16, 8])
+    
+    # Pares de puntos de las distancias que se extraen por frame
+    _DIST_NAMES = (
+        'thumb_index_d', 'thumb_middle_d', 'thumb_ring_d', 'thumb_pinky_d',
+        'index_middle_d', 'middle_ring_d', 'ring_pinky_d', 'index_pinky_d',
+        'thumb_wrist_d', 'index_wrist_d', 'middle_wrist_d',
+        'thumb_to_index_base', 'index_to_middle_base'
+    )
+    _DIST_A = np.array([4, 4, 4, 4, 8, 12, 16, 8, 4, 8, 12, 4, 8])
+    _DIST_B = np.array([8, 12, 16, 20, 12, 16, 20, 20, 0, 0, 0, 5, 9])
+    
     def __init__(self, model_path: str = None):
         self.model = None
         self.label_encoder = None
@@ -24,17 +46,55 @@ class GestureClassifier:
         self.confidence_scores = {}
         self.last_validated_letter = None
         self.validation_counter = 0
+        
+        # Última mano procesada: letras, validación y controles comparten
+        # las mismas características dentro de un frame. Se indexa por el
+        # contenido de los landmarks, así una mano idéntica en frames
+        # consecutivos tampoco recalcula características ni reglas
+        self._cached_landmarks = None
+        self._cached_key = None
+        self._cached_features = None
+        self._cached_rule_letter = None
+    
+    def _to_landmarks_array(self, landmarks) -> Optional[np.ndarray]:
+        """Convierte landmarks (lista plana o arreglo) a un arreglo (21, 3)"""
+        if landmarks is None:
+            return None
+        if isinstance(landmarks, np.ndarray):
+            if landmarks.shape == (21, 3):
+                return landmarks
+            if landmarks.size < 63:
+                return None
+            return landmarks.reshape(-1)[:63].reshape(21, 3)
+        if len(landmarks) < 63:
+            return None
+        return np.asarray(landmarks[:63], dtype=np.float64).reshape(21, 3)
+    
+    def _get_features(self, landmarks_array: np.ndarray) -> Dict:
+        """Extrae características reutilizando las de la última mano"""
+        if landmarks_array is not self._cached_landmarks:
+            key = landmarks_array.tobytes()
+            if key != self._cached_key:
+                self._cached_features = self._extract_ultra_precise_features(landmarks_array)
+                self._cached_rule_letter = None
+                self._cached_key = key
+            self._cached_landmarks = landmarks_array
+        return self._cached_features
     
     def predict_gesture(self, landmarks: List) -> Optional[str]:
         """Predice con validación cruzada mejorada"""
-        if not self.is_trained or not landmarks or len(landmarks) < 63:
+        if not self.is_trained:
+            return None
+        
+        landmarks_array = self._to_landmarks_array(landmarks)
+        if landmarks_array is None:
             return None
         
-        current_letter = self._classify_complete_alphabet(landmarks)
+        current_letter = self._classify_complete_alphabet(landmarks_array)
         
         # Validación cruzada: verificar que la letra sea consistente
         if current_letter:
-            validated_letter = self._cross_validate_detection(current_letter, landmarks)
+            validated_letter = self._cross_validate_detection(current_letter, landmarks_array)
             current_letter = validated_letter
         
         self.detection_history.append(current_letter)
@@ -59,8 +119,8 @@ class GestureClassifier:
     def _cross_validate_detection(self, letter: str, landmarks: List) -> Optional[str]:
         """Validación cruzada para mayor precisión"""
         # Verificar que el gesto cumpla múltiples criterios
-        landmarks_array = np.array(landmarks[:63]).reshape(-1, 3)
-        features = self._extract_ultra_precise_features(landmarks_array)
+        landmarks_array = self._to_landmarks_array(landmarks)
+        features = self._get_features(landmarks_array)
         
         # Calcular score de confianza para esta letra
         confidence_score = self._calculate_gesture_confidence(letter, features)
@@ -123,13 +183,18 @@ class GestureClassifier:
         return min(1.0, confidence)
     
     def _classify_complete_alphabet(self, landmarks: List) -> Optional[str]:
-        if not landmarks or len(landmarks) < 63:
+        landmarks_array = self._to_landmarks_array(landmarks)
+        if landmarks_array is None:
             return None
         
-        landmarks_array = np.array(landmarks[:63]).reshape(-1, 3)
-        features = self._extract_ultra_precise_features(landmarks_array)
+        features = self._get_features(landmarks_array)
         
-        return self._classify_with_enhanced_rules(features, landmarks_array)
+        # Las reglas son deterministas: misma mano, misma letra
+        if self._cached_rule_letter is None:
+            self._cached_rule_letter = (
+                self._classify_with_enhanced_rules(features, landmarks_array),
+            )
+        return self._cached_rule_letter[0]
     
     def _extract_ultra_precise_features(self, lm) -> Dict:
         """Extrae características ultra precisas para cada letra"""
@@ -155,35 +220,16 @@ class GestureClassifier:
         f['middle_semi'] = middle_pip[1] < middle_mcp[1] and not f['middle_ext']
         
         # === ÁNGULOS ULTRA PRECISOS ===
-        f['thumb_angle'] = self._angle(thumb_mcp, thumb_ip, thumb_tip)
-        f['index_angle'] = self._angle(index_mcp, index_pip, index_tip)
-        f['middle_angle'] = self._angle(middle_mcp, middle_pip, middle_tip)
-        f['ring_angle'] = self._angle(ring_mcp, ring_pip, ring_tip)
-        f['pinky_angle'] = self._angle(pinky_mcp, pinky_pip, pinky_tip)
-        
-        # Ángulos entre dedos
-        f['index_middle_angle'] = self._angle(index_tip, index_mcp, middle_tip)
-        f['middle_ring_angle'] = self._angle(middle_tip, middle_mcp, ring_tip)
-        f['thumb_index_angle'] = self._angle(thumb_tip, wrist, index_tip)
+        # Todos los ángulos en una sola operación vectorizada
+        angles = self._angles(lm[self._ANGLE_A], lm[self._ANGLE_B], lm[self._ANGLE_C])
+        for name, value in zip(self._ANGLE_NAMES, angles.tolist()):
+            f[name] = value
         
         # === DISTANCIAS CRÍTICAS ===
-        f['thumb_index_d'] = np.linalg.norm(thumb_tip - index_tip)
-        f['thumb_middle_d'] = np.linalg.norm(thumb_tip - middle_tip)
-        f['thumb_ring_d'] = np.linalg.norm(thumb_tip - ring_tip)
-        f['thumb_pinky_d'] = np.linalg.norm(thumb_tip - pinky_tip)
-        f['index_middle_d'] = np.linalg.norm(index_tip - middle_tip)
-        f['middle_ring_d'] = np.linalg.norm(middle_tip - ring_tip)
-        f['ring_pinky_d'] = np.linalg.norm(ring_tip - pinky_tip)
-        f['index_pinky_d'] = np.linalg.norm(index_tip - pinky_tip)
-        
-        # Distancias a la muñeca
-        f['thumb_wrist_d'] = np.linalg.norm(thumb_tip - wrist)
-        f['index_wrist_d'] = np.linalg.norm(index_tip - wrist)
-        f['middle_wrist_d'] = np.linalg.norm(middle_tip - wrist)
-        
-        # Distancias entre bases y puntas
-        f['thumb_to_index_base'] = np.linalg.norm(thumb_tip - index_mcp)
-        f['index_to_middle_base'] = np.linalg.norm(index_tip - middle_mcp)
+        # Incluye distancias a la muñeca y entre bases y puntas
+        distances = np.linalg.norm(lm[self._DIST_A] - lm[self._DIST_B], axis=1)
+        for name, value in zip(self._DIST_NAMES, distances.tolist()):
+            f[name] = value
         
         # === POSICIONES RELATIVAS EN 3D ===
         f['thumb_left'] = thumb_tip[0] < index_mcp[0] - 0.05
@@ -497,11 +543,11 @@ class GestureClassifier:
         Detecta gestos de control especiales
         Retorna: 'DELETE', 'SPACE', 'CLEAR', 'PAUSE', o None
         """
-        if not landmarks or len(landmarks) < 63:
+        landmarks_array = self._to_landmarks_array(landmarks)
+        if landmarks_array is None:
             return None
         
-        landmarks_array = np.array(landmarks[:63]).reshape(-1, 3)
-        features = self._extract_ultra_precise_features(landmarks_array)
+        features = self._get_features(landmarks_array)
         
         # Verificar gestos de control
         control = self._classify_control_gestures(features, landmarks_array)
@@ -534,7 +580,7 @@ class GestureClassifier:
     
         delete_check3 = (abs(thumb_tip[1] - wrist[1]) < 0.08)  
         if delete_check1 and delete_check2 and delete_check3:
-           print(f"[DEBUG DELETE] 👈 Pulgar izquierda detectado!")
+           logger.debug("Gesto DELETE: pulgar izquierda detectado")
            return "DELETE"
         
         # ===== GESTO: ESPACIO (SPACE) =====
@@ -548,7 +594,7 @@ class GestureClassifier:
                     f['middle_ring_d'] < 0.06 and
                     f['ring_pinky_d'] < 0.06)
         if space_check1 and space_check2:
-         print(f"[DEBUG SPACE] ✋ Mano abierta detectada (candidata para espacio)")
+         logger.debug("Gesto SPACE: mano abierta detectada (candidata para espacio)")
          return "SPACE_CANDIDATE"  # Requiere ambas manos
         
         # ===== GESTO: LIMPIAR TODO (CLEAR) =====
@@ -567,6 +613,16 @@ class GestureClassifier:
         
         return None
     
+    def _angles(self, p1, p2, p3) -> np.ndarray:
+        """Versión vectorizada de _angle para arreglos (N, 3)"""
+        v1 = p1 - p2
+        v2 = p3 - p2
+        norms = np.linalg.norm(v1, axis=1) * np.linalg.norm(v2, axis=1)
+        dots = np.einsum('ij,ij->i', v1, v2)
+        valid = norms > 0
+        cos_angle = np.clip(dots / np.where(valid, norms, 1.0), -1.0, 1.0)
+        return np.where(valid, np.degrees(np.arccos(cos_angle)), 0.0)
+    
     def _angle(self, p1, p2, p3):
         v1 = p1 - p2
         v2 = p3 - p2
@@ -4,10 +4,13 @@ Gestos de Control para el Traductor de Señas
 CONFIGURACIÓN PERSONALIZADA: Espacio con 2 manos abiertas
 """
 
+import logging
 import numpy as np
 from typing import Optional, Dict, List
 from collections import deque
 
+logger = logging.getLogger(__name__)
+
 class GestureControls:
     """
     Gestor de gestos de control especiales
@@ -55,7 +58,7 @@ class GestureControls:
                 self.last_control = None
                 self.control_cooldown = 0
                 self.control_history.clear()
-                print(f"[CONTROL] 🔄 Reset - listo para nuevo gesto")
+                logger.debug("Control reiniciado, listo para nuevo gesto")
             
             return None
         
@@ -99,7 +102,7 @@ class GestureControls:
                     self.control_cooldown = self.cooldown_frames
                     self.control_history.clear()  # Limpiar historial después de ejecutar
                     
-                    print(f"[CONTROL] ✅ Gesto ejecutado: {control_gesture}")
+                    logger.info("Gesto de control ejecutado: %s", control_gesture)
                     return control_gesture
         
         return None
@@ -128,13 +131,13 @@ class GestureControls:
             right_open = self._is_hand_fully_open(right_array)
             
             if left_open and right_open:
-                print(f"[DEBUG SPACE] ✋✋ Ambas manos abiertas detectadas!")
+                logger.debug("Gesto SPACE: ambas manos abiertas detectadas")
                 return True
             else:
                 return False
                 
         except Exception as e:
-            print(f"[ERROR] Error detectando espacio: {e}")
+            logger.error("Error detectando espacio: %s", e)
             return False
     
     def _is_hand_fully_open(self, lm) -> bool:
@@ -182,12 +185,12 @@ class GestureControls:
             right_fist = self._is_fist(right_array)
             
             if left_fist and right_fist:
-                print(f"[DEBUG CLEAR] 👊👊 Ambos puños detectados!")
+                logger.debug("Gesto CLEAR: ambos puños detectados")
                 return True
             return False
             
         except Exception as e:
-            print(f"[ERROR] Error detectando clear: {e}")
+            logger.error("Error detectando clear: %s", e)
             return False
     
     def _is_fist(self, lm) -> bool:
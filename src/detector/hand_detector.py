@@ -9,39 +9,73 @@ class HandDetector:
     def __init__(self, 
                  max_num_hands: int = 2,
                  min_detection_confidence: float = 0.7,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 static_image_mode: bool = False,
+                 inference_width: Optional[int] = None):
         
         # Inicializar MediaPipe
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.static_image_mode = static_image_mode
+        self.inference_width = inference_width
+        self._inference_buffer = None
+        
         # Configurar el detector de manos
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_num_hands,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence
-        )
+        self.hands = self._create_hands()
         
         # Variables para tracking mejorado
         self.hand_history = []
         self.detection_stability = 0
         
+    def _create_hands(self):
+        """Crea la instancia de MediaPipe Hands con la configuración actual"""
+        return self.mp_hands.Hands(
+            static_image_mode=self.static_image_mode,
+            max_num_hands=self.max_num_hands,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
+        )
+    
+    def _resize_for_inference(self, frame: np.ndarray) -> np.ndarray:
+        """Reduce el frame al ancho de inferencia conservando la proporción"""
+        height, width = frame.shape[:2]
+        if not self.inference_width or width <= self.inference_width:
+            return frame
+        
+        scale = self.inference_width / width
+        shape = (int(round(height * scale)), self.inference_width) + frame.shape[2:]
+        # El frame reducido solo vive hasta el cvtColor: se reutiliza el mismo buffer
+        if self._inference_buffer is None or self._inference_buffer.shape != shape:
+            self._inference_buffer = np.empty(shape, dtype=frame.dtype)
+        return cv2.resize(
+            frame,
+            (shape[1], shape[0]),
+            dst=self._inference_buffer,
+            interpolation=cv2.INTER_AREA
+        )
+    
+    def preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Este detector no ajusta el frame: se muestra tal como llega"""
+        return frame
+    
     def detect_hands(self, frame: np.ndarray) -> Tuple[np.ndarray, Dict]:
         """
         Detecta manos usando MediaPipe y las clasifica por izquierda/derecha
         """
-        # Convertir BGR a RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Convertir BGR a RGB (reducido: MediaPipe devuelve coordenadas normalizadas)
+        rgb_frame = cv2.cvtColor(self._resize_for_inference(frame), cv2.COLOR_BGR2RGB)
         rgb_frame.flags.writeable = False
         
         # Procesar el frame con MediaPipe
         results = self.hands.process(rgb_frame)
         
-        # Convertir de vuelta a BGR
-        rgb_frame.flags.writeable = True
-        processed_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
+        # Dibujar sobre el frame a resolución completa
+        processed_frame = frame.copy()
         
         # Diccionario para almacenar landmarks por mano
         hands_data = {
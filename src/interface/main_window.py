@@ -4,9 +4,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import cv2
+import numpy as np
 from PIL import Image, ImageTk
+import sys
+import math
 import threading
-from typing import Optional
+import queue
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from ..detector.hand_detector import HandDetector
 from ..detector.gesture_classifier import GestureClassifier
@@ -22,6 +31,107 @@ from ..utils.word_sentence_manager import WordSentenceManager
 from ..utils.audio_manager import AudioManager
 from ..config.settings import Config
 
+
+class _RateLimitFilter(logging.Filter):
+    """Descarta mensajes repetidos dentro de una ventana de tiempo"""
+    
+    def __init__(self, interval: float = 1.0, max_entries: int = 256):
+        super().__init__()
+        self.interval = interval
+        self.max_entries = max_entries
+        self._last_seen = {}
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        message = record.getMessage()
+        last = self._last_seen.get(message)
+        
+        if last is not None and now - last < self.interval:
+            return False
+        
+        # Evitar que el diccionario crezca sin límite con mensajes distintos
+        if len(self._last_seen) >= self.max_entries:
+            self._last_seen = {
+                msg: ts for msg, ts in self._last_seen.items()
+                if now - ts < self.interval
+            }
+        
+        self._last_seen[message] = now
+        return True
+
+
+logger = logging.getLogger(__name__)
+logger.addFilter(_RateLimitFilter())
+
+
+# Descripciones de los gestos de palabras completas, organizadas por categorías.
+# Se construyen una sola vez al importar el módulo y son de solo lectura.
+_GESTURE_CATEGORIES: Dict[str, Mapping[str, Tuple[str, str]]] = {
+    '🤝 SALUDOS Y CORTESÍA': MappingProxyType({
+        'THUMBS_UP': ('👍', 'Pulgar arriba'),
+        'WAVE': ('👋', 'Mano oscilando'),
+        'PEACE': ('✌️', 'Dedos en V'),
+        'OK_SIGN': ('👌', 'Círculo OK'),
+        'PRAY_HANDS': ('🙏', 'Manos juntas'),
+        'BOW': ('🙇', 'Reverencia'),
+    }),
+    '💬 RESPUESTAS': MappingProxyType({
+        'THUMBS_DOWN': ('👎', 'Pulgar abajo'),
+        'NOD_YES': ('✅', 'Asentir'),
+        'SHAKA': ('🤙', 'Shaka'),
+        'FIST_UP': ('✊', 'Puño arriba'),
+    }),
+    '🍽️ NECESIDADES': MappingProxyType({
+        'POINTING_UP': ('☝️', 'Índice arriba'),
+        'DRINK_GESTURE': ('🥤', 'Beber'),
+        'EAT_GESTURE': ('🍴', 'Comer'),
+        'BATHROOM_SIGN': ('🚽', 'Baño'),
+        'SLEEP_GESTURE': ('😴', 'Dormir'),
+    }),
+    '👨‍👩‍👧 FAMILIA': MappingProxyType({
+        'HEART_HANDS': ('❤️', 'Corazón con manos'),
+        'MAMA_SIGN': ('👩', 'Mamá'),
+        'PAPA_SIGN': ('👨', 'Papá'),
+        'BABY_ROCK': ('👶', 'Mecer bebé'),
+        'FAMILY_SIGN': ('👨‍👩‍👧', 'Familia'),
+    }),
+    '😊 EMOCIONES': MappingProxyType({
+        'HAPPY_SIGN': ('😊', 'Sonrisa'),
+        'SAD_SIGN': ('😢', 'Triste'),
+        'ANGRY_FIST': ('😠', 'Puño enojado'),
+        'SCARED_HANDS': ('😨', 'Manos asustadas'),
+        'LOVE_HEART': ('💕', 'Amor'),
+    }),
+    '🎯 ACCIONES': MappingProxyType({
+        'CALL_ME': ('📞', 'Llámame'),
+        'COME_HERE': ('👈', 'Ven aquí'),
+        'GO_AWAY': ('👉', 'Vete'),
+        'WAIT_HAND': ('✋', 'Espera'),
+        'STOP_HAND': ('🛑', 'Alto'),
+    }),
+    '📍 LUGARES': MappingProxyType({
+        'HOME_SIGN': ('🏠', 'Casa'),
+        'SCHOOL_SIGN': ('🏫', 'Escuela'),
+        'WORK_SIGN': ('💼', 'Trabajo'),
+        'HOSPITAL_CROSS': ('🏥', 'Hospital'),
+    }),
+    '⏰ TIEMPO': MappingProxyType({
+        'NOW_SIGN': ('⏰', 'Ahora'),
+        'LATER_SIGN': ('🕐', 'Después'),
+        'TODAY_SIGN': ('📅', 'Hoy'),
+        'TOMORROW_POINT': ('➡️', 'Mañana'),
+    }),
+    '💼 ÚTILES': MappingProxyType({
+        'PHONE_CALL': ('📱', 'Teléfono'),
+        'WRITE_SIGN': ('✍️', 'Escribir'),
+        'READ_SIGN': ('📖', 'Leer'),
+        'LISTEN_EAR': ('👂', 'Escuchar'),
+        'MONEY_RUB': ('💰', 'Dinero'),
+        'FRIEND_LINK': ('🤝', 'Amigo'),
+    }),
+}
+
+
 class MainWindow:
     # PALETA DE COLORES MODERNA
     COLORS = {
@@ -38,6 +148,9 @@ class MainWindow:
         'hover': '#1E40AF',
     }
     
+    # Número máximo de sugerencias visibles
+    MAX_SUGGESTION_BUTTONS = 5
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🤟 " + Config.WINDOW_TITLE)
@@ -56,13 +169,17 @@ class MainWindow:
             self.hand_detector = AdvancedHandDetector(
                 max_num_hands=Config.MAX_NUM_HANDS,
                 min_detection_confidence=Config.MIN_DETECTION_CONFIDENCE,
-                min_tracking_confidence=Config.MIN_TRACKING_CONFIDENCE
+                min_tracking_confidence=Config.MIN_TRACKING_CONFIDENCE,
+                static_image_mode=not Config.TRACKING_MODE,
+                inference_width=Config.INFERENCE_WIDTH
             )
         else:
             self.hand_detector = HandDetector(
                 max_num_hands=Config.MAX_NUM_HANDS,
                 min_detection_confidence=Config.MIN_DETECTION_CONFIDENCE,
-                min_tracking_confidence=Config.MIN_TRACKING_CONFIDENCE
+                min_tracking_confidence=Config.MIN_TRACKING_CONFIDENCE,
+                static_image_mode=not Config.TRACKING_MODE,
+                inference_width=Config.INFERENCE_WIDTH
             )
             
         self.gesture_classifier = GestureClassifier()
@@ -70,19 +187,56 @@ class MainWindow:
         self.gesture_calibrator = GestureCalibrator()
         self.gesture_controls = GestureControls()
         self.complete_word_detector = CompleteWordDetector()
-        self.word_dictionary = WordDictionary()
         self.word_suggester = WordSuggester()
-        self.sentence_bank = SentenceBank()
+        # Diccionario y banco de oraciones se crean al primer uso
+        self._word_dictionary = None
+        self._sentence_bank = None
         self.word_sentence_manager = WordSentenceManager()
         self.audio_manager = AudioManager(
             rate=Config.VOICE_RATE,
             volume=Config.VOICE_VOLUME
         )
         
+        # Síntesis de voz en un hilo propio para no congelar la interfaz
+        self._tts_executor = ThreadPoolExecutor(max_workers=1)
+        self._tts_future = None
+        
         # Variables de estado
         self.cap = None
         self.is_running = False
         self.current_frame = None
+        
+        # Captura en hilo propio: solo se conserva el frame más reciente
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._latest_frame = None
+        self._capture_thread = None
+        self._detection_thread = None
+        
+        # Resultados de inferencia hacia el hilo de Tk: solo el último frame
+        # procesado, pero los eventos (palabras, controles) nunca se descartan
+        self._result_queue = queue.Queue(maxsize=1)
+        self._event_queue = queue.Queue()
+        # El hilo de detección avisa con <<Detection>>; solo un aviso en vuelo
+        self._ui_notify_pending = threading.Event()
+        
+        # Sin manos a la vista el detector corre solo cada _detect_stride frames
+        self.idle_miss_frames = 15
+        self.idle_detect_stride = 4
+        self._miss_streak = 0
+        self._detect_stride = 1
+        self._frame_ix = 0
+        
+        # Bloques de color para los overlays semitransparentes, por tamaño
+        self._tint_cache = {}
+        # Textos fijos de los overlays ya rasterizados como máscaras
+        self._text_sprites = {}
+        
+        # Imagen de video persistente: se recrea solo si cambia el tamaño
+        self._video_photo = None
+        self._rgb_buffer = None
+        self._rgb_image = None
+        self._resize_buffer = None
         self.detected_letter = ""
         self.detected_syllable = ""
         self.detection_mode = "letters"
@@ -100,6 +254,21 @@ class MainWindow:
         self.auto_space_enabled = False
         self.no_detection_count = 0
         self.auto_space_threshold = 90
+        # Tope de frecuencia del auto-agregado, por debajo del periodo de la
+        # cámara (33 ms a 30 FPS): el jitter normal no debe descartar frames,
+        # porque los umbrales de estabilidad y cooldown se cuentan en frames
+        self.auto_add_min_interval = 0.025
+        self._last_auto_add_time = 0.0
+        
+        # Confianza mostrada suavizada (EMA) e histéresis para mostrar y limpiar
+        # la letra: la detección no cambia, solo se evita que la interfaz parpadee.
+        # Los umbrales se aplican a la fracción suavizada de frames con detección
+        self.confidence_smoothing = 0.3
+        self.display_enter_threshold = 0.75
+        self.display_exit_threshold = 0.55
+        self._confidence_ema = 0.0
+        self._detection_presence = 0.0
+        self._detection_shown = False
 
         # Variables para controles
         self.control_gesture_detected = None
@@ -110,6 +279,41 @@ class MainWindow:
         self.current_suggestions = []
         self.suggestions_enabled = True
         
+        # Última palabra consultada y la lista que produjo
+        self._last_suggest_word = None
+        self._last_suggestions = None
+        
+        # Último texto mostrado: evita reescribir widgets y recontar palabras
+        self._last_current_word = None
+        self._last_sentence = None
+        self._last_word_count = -1
+        
+        # Cambios de texto agrupados: como máximo uno cada 16 ms (~60 Hz)
+        self._text_change_after_id = None
+        # Recálculo de sugerencias con debounce: solo corre el último agendado
+        self._suggest_after_id = None
+        # Restablecimientos diferidos de la barra de estado: uno pendiente por tipo
+        self._status_reset_id = None
+        self._control_feedback_after_id = None
+        # Olvido diferido de la última palabra completa
+        self._complete_word_reset_id = None
+        
+        # Ventanas secundarias: se construyen una vez y luego se ocultan
+        self._phrases_window = None
+        self._word_gestures_window = None
+        self._word_gestures_snapshot = None
+        # Gestor de precisión y galería: una sola instancia, creada al abrirlas
+        self._precision_manager = None
+        self._reference_gallery = None
+        
+        # Cambios por frame de la interfaz: se acumulan y se aplican en un
+        # solo callback idle por vuelta del bucle de eventos
+        self._ui_dirty = {}
+        self._ui_flush_id = None
+        # Últimos valores escritos en cada widget: compararlos no requiere
+        # consultar a Tcl con StringVar.get() o cget()
+        self._shown_ui = {}
+        
         # Variables para palabras completas
         self.complete_word_mode_enabled = True
         self.last_complete_word = ""
@@ -118,9 +322,26 @@ class MainWindow:
         self.setup_ui()
         self.setup_camera()
         
+        # Resultados de detección entregados por evento virtual
+        self.root.bind('<<Detection>>', self._apply_results)
+        
         # Protocolo de cierre
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    @property
+    def word_dictionary(self) -> WordDictionary:
+        """Diccionario de palabras, creado al primer acceso"""
+        if self._word_dictionary is None:
+            self._word_dictionary = WordDictionary()
+        return self._word_dictionary
+    
+    @property
+    def sentence_bank(self) -> SentenceBank:
+        """Banco de oraciones, creado al abrir por primera vez la ventana de frases"""
+        if self._sentence_bank is None:
+            self._sentence_bank = SentenceBank()
+        return self._sentence_bank
+    
     def setup_styles(self):
         """Configura los estilos personalizados de la interfaz"""
         style = ttk.Style()
@@ -161,12 +382,89 @@ class MainWindow:
         style.map('Danger.TButton',
                  background=[('active', '#DC2626')])
         
+        # Botones de la interfaz: el color al pasar el mouse lo resuelve Tk
+        # con style.map, sin callbacks <Enter>/<Leave> por cada widget
+        button_styles = {
+            'Start.TButton': (self.COLORS['primary'], self.COLORS['hover'], ('Segoe UI', 11, 'bold'), (20, 10)),
+            'Stop.TButton': (self.COLORS['danger'], '#DC2626', ('Segoe UI', 11, 'bold'), (20, 10)),
+            'Clear.TButton': (self.COLORS['danger'], '#DC2626', ('Segoe UI', 10), (15, 10)),
+            'Speak.TButton': (self.COLORS['accent'], '#059669', ('Segoe UI', 10), (15, 10)),
+            'Suggestion.TButton': (self.COLORS['secondary'], self.COLORS['hover'], ('Segoe UI', 9), (12, 5)),
+            'Phrases.TButton': (self.COLORS['primary'], self.COLORS['hover'], ('Segoe UI', 8, 'bold'), (8, 5)),
+            'Calibrate.TButton': (self.COLORS['accent'], '#059669', ('Segoe UI', 9, 'bold'), (15, 5)),
+            'Gallery.TButton': (self.COLORS['warning'], '#D97706', ('Segoe UI', 9), (12, 5)),
+            'Letters.TButton': (self.COLORS['primary'], self.COLORS['hover'], ('Segoe UI', 9), (12, 5)),
+            'Close.TButton': (self.COLORS['danger'], '#DC2626', ('Segoe UI', 11, 'bold'), (30, 10)),
+            'DialogClose.TButton': (self.COLORS['danger'], '#DC2626', ('Segoe UI', 11), (30, 10)),
+            'Confirm.TButton': (self.COLORS['primary'], self.COLORS['hover'], ('Segoe UI', 11, 'bold'), (30, 10)),
+            'AddLetter.TButton': (self.COLORS['secondary'], self.COLORS['hover'], ('Segoe UI', 7), (6, 3)),
+            'Space.TButton': (self.COLORS['accent'], '#059669', ('Segoe UI', 7, 'bold'), (8, 3)),
+            'Undo.TButton': (self.COLORS['warning'], '#D97706', ('Segoe UI', 7), (6, 3)),
+        }
+        for name, (bg, hover_bg, font, padding) in button_styles.items():
+            style.configure(
+                name,
+                background=bg,
+                foreground='white',
+                borderwidth=0,
+                focuscolor='none',
+                font=font,
+                padding=padding
+            )
+            style.map(name,
+                     background=[('pressed', hover_bg), ('active', hover_bg)],
+                     foreground=[('active', 'white')])
+        
+        # Oraciones del banco: fondo claro que se resalta al pasar el mouse
+        style.configure(
+            'Sentence.TButton',
+            background=self.COLORS['bg_light'],
+            foreground=self.COLORS['text_dark'],
+            relief='raised',
+            borderwidth=2,
+            focuscolor='none',
+            font=('Segoe UI', 11),
+            padding=(20, 12),
+            anchor='w'
+        )
+        style.map('Sentence.TButton',
+                 background=[('pressed', self.COLORS['secondary']), ('active', self.COLORS['secondary'])],
+                 foreground=[('active', 'white')],
+                 font=[('active', ('Segoe UI', 11, 'bold'))])
+        
+        # Barra de confianza: un estilo fijo por tramo de color
+        for name, color in (('ConfidenceAccent', self.COLORS['accent']),
+                            ('ConfidenceWarning', self.COLORS['warning']),
+                            ('ConfidenceDanger', self.COLORS['danger'])):
+            style.configure(
+                f'{name}.Horizontal.TProgressbar',
+                troughcolor='#E2E8F0',
+                background=color,
+                bordercolor=self.COLORS['border'],
+                lightcolor=color,
+                darkcolor=color,
+                thickness=15
+            )
+        
         style.configure(
             'Card.TFrame',
             background='white',
             relief='flat'
         )
         
+        # Fondos de los contenedores de la ventana principal: los colores se
+        # registran una vez en el estilo y no en cada Frame
+        frame_styles = {
+            'Light.TFrame': self.COLORS['bg_light'],
+            'Header.TFrame': self.COLORS['primary'],
+            'AccentHeader.TFrame': self.COLORS['accent'],
+            'StatusBar.TFrame': self.COLORS['bg_dark'],
+            'Highlight.TFrame': self.COLORS['secondary'],
+            'Border.TFrame': self.COLORS['border'],
+        }
+        for name, background in frame_styles.items():
+            style.configure(name, background=background)
+        
         style.configure(
             'TLabelframe',
             background='white',
@@ -210,11 +508,14 @@ class MainWindow:
     
     def setup_ui(self):
         """Configura la interfaz de usuario moderna"""
-        main_frame = tk.Frame(self.root, bg=self.COLORS['bg_light'])
+        # La paleta se consulta en casi cada widget: una sola búsqueda de atributo
+        colors = self.COLORS
+        
+        main_frame = ttk.Frame(self.root, style='Light.TFrame')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
         
         # HEADER
-        header_frame = tk.Frame(main_frame, bg='white', relief='raised', bd=2)
+        header_frame = ttk.Frame(main_frame, style='Card.TFrame', relief='raised', borderwidth=2)
         header_frame.pack(fill=tk.X, pady=(0, 15))
         
         title_label = tk.Label(
@@ -222,70 +523,49 @@ class MainWindow:
             text="🤟 Traductor de Lenguaje de Señas",
             font=('Segoe UI', 20, 'bold'),
             bg='white',
-            fg=self.COLORS['primary']
+            fg=colors['primary']
         )
         title_label.pack(pady=15)
         
-        control_frame = tk.Frame(header_frame, bg='white')
+        control_frame = ttk.Frame(header_frame, style='Card.TFrame')
         control_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        buttons_frame = tk.Frame(control_frame, bg='white')
+        buttons_frame = ttk.Frame(control_frame, style='Card.TFrame')
         buttons_frame.pack(side=tk.LEFT)
         
-        self.start_button = tk.Button(
+        self.start_button = ttk.Button(
             buttons_frame,
             text="▶ Iniciar Detección",
             command=self.toggle_detection,
-            bg=self.COLORS['primary'],
-            fg='white',
-            font=('Segoe UI', 11, 'bold'),
-            relief='flat',
-            padx=20,
-            pady=10,
-            cursor='hand2'
+            cursor='hand2',
+            style='Start.TButton'
         )
         self.start_button.pack(side=tk.LEFT, padx=5)
-        self.start_button.bind('<Enter>', lambda e: self.start_button.config(bg=self.COLORS['hover']))
-        self.start_button.bind('<Leave>', lambda e: self.start_button.config(bg=self.COLORS['primary']))
         
-        clear_button = tk.Button(
+        clear_button = ttk.Button(
             buttons_frame,
             text="🗑 Limpiar",
             command=self.clear_text,
-            bg=self.COLORS['danger'],
-            fg='white',
-            font=('Segoe UI', 10),
-            relief='flat',
-            padx=15,
-            pady=10,
-            cursor='hand2'
+            cursor='hand2',
+            style='Clear.TButton'
         )
         clear_button.pack(side=tk.LEFT, padx=5)
-        clear_button.bind('<Enter>', lambda e: clear_button.config(bg='#DC2626'))
-        clear_button.bind('<Leave>', lambda e: clear_button.config(bg=self.COLORS['danger']))
         
-        speak_button = tk.Button(
+        speak_button = ttk.Button(
             buttons_frame,
             text="🔊 Reproducir",
             command=self.speak_text,
-            bg=self.COLORS['accent'],
-            fg='white',
-            font=('Segoe UI', 10),
-            relief='flat',
-            padx=15,
-            pady=10,
-            cursor='hand2'
+            cursor='hand2',
+            style='Speak.TButton'
         )
         speak_button.pack(side=tk.LEFT, padx=5)
-        speak_button.bind('<Enter>', lambda e: speak_button.config(bg='#059669'))
-        speak_button.bind('<Leave>', lambda e: speak_button.config(bg=self.COLORS['accent']))
         
         # Modo de detección
         mode_frame = tk.LabelFrame(
             control_frame,
             text="Modo",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 10, 'bold'),
             relief='groove',
             bd=2
@@ -301,9 +581,9 @@ class MainWindow:
             value="letters",
             command=self.change_detection_mode,
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9),
-            selectcolor=self.COLORS['secondary']
+            selectcolor=colors['secondary']
         )
         letters_radio.pack(anchor=tk.W, padx=10, pady=2)
         
@@ -314,9 +594,9 @@ class MainWindow:
             value="syllables",
             command=self.change_detection_mode,
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9),
-            selectcolor=self.COLORS['secondary']
+            selectcolor=colors['secondary']
         )
         syllables_radio.pack(anchor=tk.W, padx=10, pady=2)
         
@@ -325,7 +605,7 @@ class MainWindow:
             control_frame,
             text="⚙ Configuración",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 10, 'bold'),
             relief='groove',
             bd=2
@@ -339,9 +619,9 @@ class MainWindow:
             variable=self.auto_add_var,
             command=self.toggle_auto_add,
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9),
-            selectcolor=self.COLORS['accent']
+            selectcolor=colors['accent']
         )
         auto_add_check.pack(anchor=tk.W, padx=10, pady=2)
         
@@ -352,9 +632,9 @@ class MainWindow:
             variable=self.auto_space_var,
             command=self.toggle_auto_space,
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9),
-            selectcolor=self.COLORS['accent']
+            selectcolor=colors['accent']
         )
         auto_space_check.pack(anchor=tk.W, padx=10, pady=2)
         
@@ -365,53 +645,65 @@ class MainWindow:
             variable=self.complete_word_var,
             command=self.toggle_complete_word_mode,
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9, 'bold'),
-            selectcolor=self.COLORS['primary']
+            selectcolor=colors['primary']
         )
         complete_word_check.pack(anchor=tk.W, padx=10, pady=2)
         
         # CONTENIDO PRINCIPAL
-        content_frame = tk.Frame(main_frame, bg=self.COLORS['bg_light'])
+        content_frame = ttk.Frame(main_frame, style='Light.TFrame')
         content_frame.pack(fill=tk.BOTH, expand=True)
         
         # Frame izquierdo - VIDEO
-        left_frame = tk.Frame(content_frame, bg='white', relief='raised', bd=2)
+        left_frame = ttk.Frame(content_frame, style='Card.TFrame', relief='raised', borderwidth=2)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
-        video_header = tk.Frame(left_frame, bg=self.COLORS['primary'], height=40)
+        video_header = ttk.Frame(left_frame, style='Header.TFrame', height=40)
         video_header.pack(fill=tk.X)
         video_header.pack_propagate(False)
         
         tk.Label(
             video_header,
             text="📹 Cámara en Vivo",
-            bg=self.COLORS['primary'],
+            bg=colors['primary'],
             fg='white',
             font=('Segoe UI', 12, 'bold')
         ).pack(pady=8)
         
-        self.video_label = tk.Label(
+        # Canvas con un único item de imagen: cambiar de frame no dispara
+        # el gestor de geometría como lo hacía Label.configure(image=...)
+        self.video_canvas = tk.Canvas(
             left_frame,
-            text="Presiona 'Iniciar' para comenzar",
             bg='#F1F5F9',
-            fg=self.COLORS['text_dark'],
+            highlightthickness=0
+        )
+        self.video_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        self._video_canvas_size = (1, 1)
+        self._video_fit_key = None
+        self._video_fit_size = (640, 480)
+        self._video_text_id = self.video_canvas.create_text(
+            0, 0,
+            text="Presiona 'Iniciar' para comenzar",
+            fill=colors['text_dark'],
             font=('Segoe UI', 12)
         )
-        self.video_label.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._video_image_id = self.video_canvas.create_image(0, 0, anchor='center')
+        self.video_canvas.bind('<Configure>', self._on_video_canvas_resize)
         
         # Controles de ajuste
-        controls_frame = tk.Frame(left_frame, bg='white')
+        controls_frame = ttk.Frame(left_frame, style='Card.TFrame')
         controls_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        vel_frame = tk.Frame(controls_frame, bg='white')
+        vel_frame = ttk.Frame(controls_frame, style='Card.TFrame')
         vel_frame.pack(side=tk.LEFT, padx=10)
         
         tk.Label(
             vel_frame,
             text="⚡ Velocidad:",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9, 'bold')
         ).pack()
         
@@ -424,20 +716,20 @@ class MainWindow:
             length=120,
             command=self.update_auto_add_speed,
             bg='white',
-            fg=self.COLORS['primary'],
-            troughcolor=self.COLORS['border'],
+            fg=colors['primary'],
+            troughcolor=colors['border'],
             highlightthickness=0
         )
         speed_scale.pack()
         
-        sens_frame = tk.Frame(controls_frame, bg='white')
+        sens_frame = ttk.Frame(controls_frame, style='Card.TFrame')
         sens_frame.pack(side=tk.LEFT, padx=10)
         
         tk.Label(
             sens_frame,
             text="🎯 Sensibilidad:",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9, 'bold')
         ).pack()
         
@@ -450,37 +742,37 @@ class MainWindow:
             length=120,
             command=self.update_sensitivity,
             bg='white',
-            fg=self.COLORS['primary'],
-            troughcolor=self.COLORS['border'],
+            fg=colors['primary'],
+            troughcolor=colors['border'],
             highlightthickness=0
         )
         sensitivity_scale.pack()
         
         # Frame derecho - RESULTADOS
-        right_frame = tk.Frame(content_frame, bg='white', width=420, relief='raised', bd=2)
+        right_frame = ttk.Frame(content_frame, style='Card.TFrame', width=420, relief='raised', borderwidth=2)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH)
         right_frame.pack_propagate(False)
         
-        result_header = tk.Frame(right_frame, bg=self.COLORS['accent'], height=40)
+        result_header = ttk.Frame(right_frame, style='AccentHeader.TFrame', height=40)
         result_header.pack(fill=tk.X)
         
         tk.Label(
             result_header,
             text="✨ Resultados",
-            bg=self.COLORS['accent'],
+            bg=colors['accent'],
             fg='white',
             font=('Segoe UI', 12, 'bold')
         ).pack(pady=8)
         
         # Letra detectada
-        detection_frame = tk.Frame(right_frame, bg=self.COLORS['bg_light'], relief='groove', bd=2)
+        detection_frame = ttk.Frame(right_frame, style='Light.TFrame', relief='groove', borderwidth=2)
         detection_frame.pack(fill=tk.X, padx=15, pady=8)
         
         tk.Label(
             detection_frame,
             text="Letra Detectada",
-            bg=self.COLORS['bg_light'],
-            fg=self.COLORS['text_dark'],
+            bg=colors['bg_light'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 9, 'bold')
         ).pack(pady=2)
         
@@ -489,7 +781,7 @@ class MainWindow:
             detection_frame,
             textvariable=self.letter_var,
             bg='white',
-            fg=self.COLORS['primary'],
+            fg=colors['primary'],
             font=('Arial', 32, 'bold'),
             relief='flat',
             width=3,
@@ -498,46 +790,57 @@ class MainWindow:
         letter_display.pack(pady=3)
         
         # Barra de confianza
-        confidence_frame = tk.Frame(detection_frame, bg=self.COLORS['bg_light'])
+        confidence_frame = ttk.Frame(detection_frame, style='Light.TFrame')
         confidence_frame.pack(fill=tk.X, padx=10, pady=2)
         
         self.confidence_var = tk.DoubleVar()
         
-        self.confidence_canvas = tk.Canvas(
+        # La barra sigue a confidence_var; solo cambia de estilo al cruzar un umbral
+        self.confidence_bar = ttk.Progressbar(
             confidence_frame,
-            height=15,
-            bg='white',
-            highlightthickness=1,
-            highlightbackground=self.COLORS['border']
+            orient=tk.HORIZONTAL,
+            mode='determinate',
+            maximum=100,
+            variable=self.confidence_var,
+            style='ConfidenceDanger.Horizontal.TProgressbar'
+        )
+        self.confidence_bar.pack(fill=tk.X, pady=2)
+        
+        self._confidence_bar_style = 'ConfidenceDanger.Horizontal.TProgressbar'
+        # Estilo de la barra para cada porcentaje entero (umbrales: > 75 y > 50)
+        self._confidence_styles = tuple(
+            'ConfidenceAccent.Horizontal.TProgressbar' if c > 75 else
+            'ConfidenceWarning.Horizontal.TProgressbar' if c > 50 else
+            'ConfidenceDanger.Horizontal.TProgressbar'
+            for c in range(101)
         )
-        self.confidence_canvas.pack(fill=tk.X, pady=2)
         
         self.confidence_label = tk.Label(
             confidence_frame,
             text="0%",
-            bg=self.COLORS['bg_light'],
-            fg=self.COLORS['text_dark'],
+            bg=colors['bg_light'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 8, 'bold')
         )
         self.confidence_label.pack()
         
         # Área de texto
-        text_frame = tk.Frame(right_frame, bg='white')
+        text_frame = ttk.Frame(right_frame, style='Card.TFrame')
         text_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=3)
         
         # PALABRA ACTUAL
-        current_word_section = tk.Frame(text_frame, bg='white')
+        current_word_section = ttk.Frame(text_frame, style='Card.TFrame')
         current_word_section.pack(fill=tk.X, pady=(0, 3))
         
         tk.Label(
             current_word_section,
             text="✍️ Palabra Actual",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 8, 'bold')
         ).pack(anchor=tk.W, pady=1)
         
-        current_word_container = tk.Frame(current_word_section, bg=self.COLORS['secondary'], relief='flat', bd=2)
+        current_word_container = ttk.Frame(current_word_section, style='Highlight.TFrame', relief='flat', borderwidth=2)
         current_word_container.pack(fill=tk.X)
         
         self.current_word_text = tk.Text(
@@ -546,7 +849,7 @@ class MainWindow:
             font=('Consolas', 12, 'bold'),
             wrap=tk.WORD,
             bg='white',
-            fg=self.COLORS['primary'],
+            fg=colors['primary'],
             relief='flat',
             padx=8,
             pady=3
@@ -554,17 +857,17 @@ class MainWindow:
         self.current_word_text.pack(fill=tk.X, padx=2, pady=2)
         
         # ORACIÓN COMPLETA
-        sentence_section = tk.Frame(text_frame, bg='white')
+        sentence_section = ttk.Frame(text_frame, style='Card.TFrame')
         sentence_section.pack(fill=tk.X, pady=(3, 0))
         
-        sentence_header = tk.Frame(sentence_section, bg='white')
+        sentence_header = ttk.Frame(sentence_section, style='Card.TFrame')
         sentence_header.pack(fill=tk.X)
         
         tk.Label(
             sentence_header,
             text="📝 Oración Completa",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 8, 'bold')
         ).pack(side=tk.LEFT, pady=1)
         
@@ -572,12 +875,12 @@ class MainWindow:
             sentence_header,
             text="0 palabras",
             bg='white',
-            fg=self.COLORS['border'],
+            fg=colors['border'],
             font=('Segoe UI', 7, 'italic')
         )
         self.word_count_label.pack(side=tk.RIGHT, pady=1)
         
-        sentence_container = tk.Frame(sentence_section, bg=self.COLORS['border'], relief='flat', bd=1)
+        sentence_container = ttk.Frame(sentence_section, style='Border.TFrame', relief='flat', borderwidth=1)
         sentence_container.pack(fill=tk.X)
         
         self.sentence_text = tk.Text(
@@ -586,7 +889,7 @@ class MainWindow:
             font=('Consolas', 10),
             wrap=tk.WORD,
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             relief='flat',
             padx=6,
             pady=3
@@ -599,103 +902,99 @@ class MainWindow:
         self.sentence_text.bind('<KeyRelease>', self.on_text_change)
         
         # Botones de texto
-        text_buttons_frame = tk.Frame(text_frame, bg='white')
+        text_buttons_frame = ttk.Frame(text_frame, style='Card.TFrame')
         text_buttons_frame.pack(fill=tk.X, pady=3)
         
-        add_letter_btn = tk.Button(
+        add_letter_btn = ttk.Button(
             text_buttons_frame,
             text="+ Letra",
             command=self.add_letter_to_word,
-            bg=self.COLORS['secondary'],
-            fg='white',
-            font=('Segoe UI', 7),
-            relief='flat',
-            padx=6,
-            pady=3,
-            cursor='hand2'
+            cursor='hand2',
+            style='AddLetter.TButton'
         )
         add_letter_btn.pack(side=tk.LEFT, padx=2)
         
-        space_btn = tk.Button(
+        space_btn = ttk.Button(
             text_buttons_frame,
             text="⎵ Espacio",
             command=self.confirm_word,
-            bg=self.COLORS['accent'],
-            fg='white',
-            font=('Segoe UI', 7, 'bold'),
-            relief='flat',
-            padx=8,
-            pady=3,
-            cursor='hand2'
+            cursor='hand2',
+            style='Space.TButton'
         )
         space_btn.pack(side=tk.LEFT, padx=2)
         
-        undo_btn = tk.Button(
+        undo_btn = ttk.Button(
             text_buttons_frame,
             text="↶ Deshacer",
             command=self.undo_last_word,
-            bg=self.COLORS['warning'],
-            fg='white',
-            font=('Segoe UI', 7),
-            relief='flat',
-            padx=6,
-            pady=3,
-            cursor='hand2'
+            cursor='hand2',
+            style='Undo.TButton'
         )
         undo_btn.pack(side=tk.RIGHT, padx=2)
 
         # SUGERENCIAS
-        suggestions_container = tk.Frame(text_frame, bg='white')
+        suggestions_container = ttk.Frame(text_frame, style='Card.TFrame')
         suggestions_container.pack(fill=tk.BOTH, expand=True, pady=5)
         
         tk.Label(
             suggestions_container,
             text="💡 Sugerencias:",
             bg='white',
-            fg=self.COLORS['text_dark'],
+            fg=colors['text_dark'],
             font=('Segoe UI', 8, 'bold')
         ).pack(anchor=tk.W)
         
-        self.suggestions_frame = tk.Frame(suggestions_container, bg='white', height=30)
+        self.suggestions_frame = ttk.Frame(suggestions_container, style='Card.TFrame', height=30)
         self.suggestions_frame.pack(fill=tk.X, pady=2)
         self.suggestions_frame.pack_propagate(False)
         
-        tk.Label(
+        # Botones de sugerencia reutilizables: se reconfiguran, no se recrean
+        self._suggestions_empty_label = tk.Label(
             self.suggestions_frame,
-            text="Escribe para sugerencias...",
+            text="Escribe para ver sugerencias...",
             bg='white',
-            fg=self.COLORS['border'],
-            font=('Segoe UI', 7, 'italic')
-        ).pack()
+            fg=colors['border'],
+            font=('Segoe UI', 9, 'italic')
+        )
+        self._suggestions_empty_label.pack(pady=5)
+        
+        # Cada botón tiene un comando fijo que lee su palabra del slot: volver
+        # a asignar command registraría un comando Tcl nuevo en cada cambio
+        self._suggestion_buttons = []
+        self._suggestion_slots = [None] * self.MAX_SUGGESTION_BUTTONS
+        self._last_rendered_suggestions = None
+        for i in range(self.MAX_SUGGESTION_BUTTONS):
+            btn = ttk.Button(
+                self.suggestions_frame,
+                text="",
+                cursor='hand2',
+                style='Suggestion.TButton',
+                command=partial(self._apply_suggestion_slot, i)
+            )
+            self._suggestion_buttons.append(btn)
         
-        tk.Frame(suggestions_container, bg=self.COLORS['border'], height=1).pack(fill=tk.X, pady=5)
+        ttk.Frame(suggestions_container, style='Border.TFrame', height=1).pack(fill=tk.X, pady=5)
         
-        phrases_btn = tk.Button(
+        phrases_btn = ttk.Button(
             suggestions_container,
             text="📝 Ver Frases Completas",
             command=self.show_phrases_window,
-            bg=self.COLORS['primary'],
-            fg='white',
-            font=('Segoe UI', 8, 'bold'),
-            relief='flat',
-            padx=8,
-            pady=5,
-            cursor='hand2'
+            cursor='hand2',
+            style='Phrases.TButton'
         )
         phrases_btn.pack(fill=tk.X)
-        phrases_btn.bind('<Enter>', lambda e: phrases_btn.config(bg=self.COLORS['hover']))
-        phrases_btn.bind('<Leave>', lambda e: phrases_btn.config(bg=self.COLORS['primary']))
         
         # BARRA DE ESTADO
-        status_bar = tk.Frame(main_frame, bg=self.COLORS['bg_dark'], height=35)
+        status_bar = ttk.Frame(main_frame, style='StatusBar.TFrame', height=35)
         status_bar.pack(fill=tk.X, pady=(15, 0))
         
         self.status_var = tk.StringVar(value="✓ Listo para iniciar")
+        self._last_status = self.status_var.get()
         status_label = tk.Label(
             status_bar,
             textvariable=self.status_var,
-            bg=self.COLORS['bg_dark'],
-            fg=self.COLORS['text_light'],
+            bg=colors['bg_dark'],
+            fg=colors['text_light'],
             font=('Segoe UI', 9)
         )
         status_label.pack(side=tk.LEFT, padx=15, pady=5)
@@ -704,69 +1003,56 @@ class MainWindow:
         counter_label = tk.Label(
             status_bar,
             textvariable=self.detection_counter_var,
-            bg=self.COLORS['bg_dark'],
-            fg=self.COLORS['accent'],
+            bg=colors['bg_dark'],
+            fg=colors['accent'],
             font=('Segoe UI', 9, 'bold')
         )
         counter_label.pack(side=tk.RIGHT, padx=15, pady=5)
         
-        tools_buttons_frame = tk.Frame(status_bar, bg=self.COLORS['bg_dark'])
+        tools_buttons_frame = ttk.Frame(status_bar, style='StatusBar.TFrame')
         tools_buttons_frame.pack(side=tk.RIGHT, padx=10)
         
-        calibrate_btn = tk.Button(
+        calibrate_btn = ttk.Button(
             tools_buttons_frame,
             text="🎯 Calibrar",
             command=self.show_precision_manager,
-            bg=self.COLORS['accent'],
-            fg='white',
-            font=('Segoe UI', 9, 'bold'),
-            relief='flat',
-            padx=15,
-            pady=5,
-            cursor='hand2'
+            cursor='hand2',
+            style='Calibrate.TButton'
         )
         calibrate_btn.pack(side=tk.LEFT, padx=3)
-        calibrate_btn.bind('<Enter>', lambda e: calibrate_btn.config(bg='#059669'))
-        calibrate_btn.bind('<Leave>', lambda e: calibrate_btn.config(bg=self.COLORS['accent']))
         
-        gallery_btn = tk.Button(
+        gallery_btn = ttk.Button(
             tools_buttons_frame,
             text="🖼 Referencias",
             command=self.show_reference_gallery,
-            bg=self.COLORS['warning'],
-            fg='white',
-            font=('Segoe UI', 9),
-            relief='flat',
-            padx=12,
-            pady=5,
-            cursor='hand2'
+            cursor='hand2',
+            style='Gallery.TButton'
         )
         gallery_btn.pack(side=tk.LEFT, padx=3)
-        gallery_btn.bind('<Enter>', lambda e: gallery_btn.config(bg='#D97706'))
-        gallery_btn.bind('<Leave>', lambda e: gallery_btn.config(bg=self.COLORS['warning']))
         
-        letters_btn = tk.Button(
+        letters_btn = ttk.Button(
             tools_buttons_frame,
             text="📚 Letras",
             command=self.show_supported_letters,
-            bg=self.COLORS['primary'],
-            fg='white',
-            font=('Segoe UI', 9),
-            relief='flat',
-            padx=12,
-            pady=5,
-            cursor='hand2'
+            cursor='hand2',
+            style='Letters.TButton'
         )
         letters_btn.pack(side=tk.LEFT, padx=3)
-        letters_btn.bind('<Enter>', lambda e: letters_btn.config(bg=self.COLORS['hover']))
-        letters_btn.bind('<Leave>', lambda e: letters_btn.config(bg=self.COLORS['primary']))
 
     def show_phrases_window(self):
         """Muestra ventana del banco de oraciones"""
+        if self._phrases_window is not None and self._phrases_window.winfo_exists():
+            self._phrases_window.deiconify()
+            self._phrases_window.lift()
+            return
+        
         phrases_window = tk.Toplevel(self.root)
+        self._phrases_window = phrases_window
         phrases_window.title("📚 Banco de Oraciones")
         phrases_window.geometry("800x700")
         phrases_window.configure(bg='white')
+        # Cerrar solo oculta: reabrir no vuelve a crear cientos de botones
+        phrases_window.protocol("WM_DELETE_WINDOW", phrases_window.withdraw)
         
         header = tk.Frame(phrases_window, bg=self.COLORS['primary'], height=70)
         header.pack(fill=tk.X)
@@ -798,6 +1084,7 @@ class MainWindow:
         style.configure('TNotebook.Tab', padding=[20, 10], font=('Segoe UI', 10))
         
         categories = self.sentence_bank.get_categories()
+        tab_canvases = []
         
         for category_key in categories:
             category_info = self.sentence_bank.get_category_info(category_key)
@@ -815,46 +1102,34 @@ class MainWindow:
                 lambda e, c=canvas: c.configure(scrollregion=c.bbox("all"))
             )
             
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", width=750)
+            window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
             canvas.configure(yscrollcommand=scrollbar.set)
+            # El contenido toma el ancho real del canvas en lugar de uno fijo
+            canvas.bind(
+                "<Configure>",
+                lambda e, c=canvas, w=window_id: c.itemconfigure(w, width=e.width)
+            )
+            tab_canvases.append(canvas)
             
             canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
             scrollbar.pack(side="right", fill="y")
             
             for sentence in sentences:
-                sentence_btn = tk.Button(
+                sentence_btn = ttk.Button(
                     scrollable_frame,
                     text=sentence,
-                    command=lambda s=sentence, w=phrases_window: self.select_sentence_from_bank(s, w),
-                    bg=self.COLORS['bg_light'],
-                    fg=self.COLORS['text_dark'],
-                    font=('Segoe UI', 11),
-                    relief='raised',
-                    bd=2,
-                    padx=20,
-                    pady=12,
+                    command=partial(self.select_sentence_from_bank, sentence, phrases_window),
                     cursor='hand2',
-                    anchor='w',
-                    justify='left'
+                    style='Sentence.TButton'
                 )
                 sentence_btn.pack(fill=tk.X, pady=3, padx=10)
-                
-                sentence_btn.bind(
-                    '<Enter>',
-                    lambda e, b=sentence_btn: b.config(
-                        bg=self.COLORS['secondary'],
-                        fg='white',
-                        font=('Segoe UI', 11, 'bold')
-                    )
-                )
-                sentence_btn.bind(
-                    '<Leave>',
-                    lambda e, b=sentence_btn: b.config(
-                        bg=self.COLORS['bg_light'],
-                        fg=self.COLORS['text_dark'],
-                        font=('Segoe UI', 11)
-                    )
-                )
+        
+        # Una sola vinculación para la rueda del mouse en toda la ventana:
+        # desplaza el canvas de la pestaña visible
+        scroll = partial(self._scroll_phrases_tab, notebook=notebook, canvases=tab_canvases)
+        phrases_window.bind('<MouseWheel>', scroll)
+        phrases_window.bind('<Button-4>', scroll)
+        phrases_window.bind('<Button-5>', scroll)
         
         footer = tk.Frame(phrases_window, bg=self.COLORS['bg_light'], height=60)
         footer.pack(fill=tk.X, side=tk.BOTTOM)
@@ -870,31 +1145,32 @@ class MainWindow:
             font=('Segoe UI', 9)
         ).pack(side=tk.LEFT, padx=20, pady=15)
         
-        close_btn = tk.Button(
+        close_btn = ttk.Button(
             footer,
             text="Cerrar",
-            command=phrases_window.destroy,
-            bg=self.COLORS['danger'],
-            fg='white',
-            font=('Segoe UI', 11, 'bold'),
-            relief='flat',
-            padx=30,
-            pady=10,
-            cursor='hand2'
+            command=phrases_window.withdraw,
+            cursor='hand2',
+            style='Close.TButton'
         )
         close_btn.pack(side=tk.RIGHT, padx=20, pady=10)
-        close_btn.bind('<Enter>', lambda e: close_btn.config(bg='#DC2626'))
-        close_btn.bind('<Leave>', lambda e: close_btn.config(bg=self.COLORS['danger']))
+    
+    def _scroll_phrases_tab(self, event, notebook, canvases):
+        """Desplaza con la rueda del mouse la pestaña activa del banco"""
+        if not canvases:
+            return
+        canvas = canvases[notebook.index('current')]
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            canvas.yview_scroll(-1, 'units')
+        elif event.num == 5 or getattr(event, 'delta', 0) < 0:
+            canvas.yview_scroll(1, 'units')
     
     def select_sentence_from_bank(self, sentence: str, window):
         """Selecciona una oración del banco y cierra la ventana"""
         self.apply_phrase(sentence)
+        self.sentence_bank.register_usage(sentence)
         
-        if hasattr(self, 'sentence_bank'):
-            self.sentence_bank.register_usage(sentence)
-        
-        window.destroy()
-        self.status_var.set(f"✓ Oración agregada: {sentence}")
+        window.withdraw()
+        self._set_status(f"✓ Oración agregada: {sentence}")
     
     def select_phrase(self, phrase: str, window):
         """Selecciona una frase y cierra la ventana"""
@@ -902,55 +1178,40 @@ class MainWindow:
         window.destroy()   
     
     def update_confidence_bar(self, confidence):
-        """Actualiza la barra de confianza personalizada"""
-        self.confidence_canvas.delete("all")
-        width = self.confidence_canvas.winfo_width()
-        height = self.confidence_canvas.winfo_height()
-        
-        if width > 1:
-            self.confidence_canvas.create_rectangle(
-                0, 0, width, height,
-                fill='#E2E8F0',
-                outline=''
-            )
-            
-            bar_width = int(width * (confidence / 100))
-            
-            if confidence > 75:
-                color = self.COLORS['accent']
-            elif confidence > 50:
-                color = self.COLORS['warning']
-            else:
-                color = self.COLORS['danger']
-            
-            self.confidence_canvas.create_rectangle(
-                0, 0, bar_width, height,
-                fill=color,
-                outline=''
-            )
+        """Actualiza el color de la barra de confianza"""
+        # El largo lo sigue la barra desde confidence_var; aquí solo se cambia
+        # el estilo, y únicamente al cruzar un umbral.
+        # Redondeo hacia arriba: 75.5 cae en 76 y conserva el umbral "> 75"
+        bar_style = self._confidence_styles[min(100, max(0, math.ceil(confidence)))]
+        if bar_style != self._confidence_bar_style:
+            self._confidence_bar_style = bar_style
+            self.confidence_bar.configure(style=bar_style)
     
     def change_detection_mode(self):
         self.detection_mode = self.mode_var.get()
         if self.detection_mode == "syllables":
             self.syllable_classifier.reset_detection_history()
-            self.status_var.set("✓ Modo sílabas - Use ambas manos")
+            self._set_status("✓ Modo sílabas - Use ambas manos")
         else:
             self.gesture_classifier.reset_detection_history()
-            self.status_var.set("✓ Modo letras - Use una mano")
+            self._set_status("✓ Modo letras - Use una mano")
         self.detected_letter = ""
         self.detected_syllable = ""
-        self.letter_var.set("-")
+        # El modo nuevo vuelve a pasar por el umbral de entrada
+        self._detection_presence = 0.0
+        self._detection_shown = False
+        self._mark_ui('letter', "-")
     
     def toggle_auto_space(self):
         self.auto_space_enabled = self.auto_space_var.get()
         status = "activado" if self.auto_space_enabled else "desactivado"
-        self.status_var.set(f"✓ Auto-espacio {status}")
+        self._set_status(f"✓ Auto-espacio {status}")
     
     def toggle_complete_word_mode(self):
         """Activa/desactiva el modo de palabras completas"""
         self.complete_word_mode_enabled = self.complete_word_var.get()
         status = "activado" if self.complete_word_mode_enabled else "desactivado"
-        self.status_var.set(f"⚡ Modo palabras completas {status}")
+        self._set_status(f"⚡ Modo palabras completas {status}")
         
         if self.complete_word_mode_enabled:
             self.show_word_gestures_info()
@@ -961,44 +1222,87 @@ class MainWindow:
             return
         
         try:
-            print(f"[DEBUG] Palabra completa detectada: {word}")
+            logger.debug("Palabra completa detectada: %s", word)
             
             if self.word_sentence_manager.add_word_by_gesture(word):
                 self.update_text_display()
                 self.last_complete_word = word
-                self.status_var.set(f"⚡ PALABRA: {word}")
+                self._set_status(f"⚡ PALABRA: {word}")
                 
-                self.root.after(2000, lambda: setattr(self, 'last_complete_word', ''))
-                self.root.after(
-                    3000, 
-                    lambda: self.status_var.set("🔴 Detectando gestos...") 
-                           if self.is_running else None
-                )
+                if self._complete_word_reset_id is not None:
+                    self.root.after_cancel(self._complete_word_reset_id)
+                self._complete_word_reset_id = self.root.after(2000, self._reset_last_complete_word)
+                self._schedule_status_reset(3000)
                 
-                print(f"[DEBUG] Palabra '{word}' agregada exitosamente")
+                logger.debug("Palabra '%s' agregada exitosamente", word)
             else:
-                print(f"[DEBUG] Error al agregar palabra '{word}'")
+                logger.debug("Error al agregar palabra '%s'", word)
                 
         except Exception as e:
-            print(f"[ERROR] Error procesando palabra completa: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error procesando palabra completa: %s", e)
+    
+    def _reset_last_complete_word(self):
+        """Permite volver a detectar la misma palabra completa"""
+        self._complete_word_reset_id = None
+        self.last_complete_word = ""
+    
+    def _blend_rect(self, frame, top_left, bottom_right, color, alpha):
+        """Mezcla un rectángulo de color sólido sobre el frame, solo en su región"""
+        x1, y1 = top_left
+        x2, y2 = bottom_right
+        roi = frame[y1:y2 + 1, x1:x2 + 1]
+        if roi.size == 0:
+            return
+        
+        # El bloque de color se guarda por tamaño: no se crea uno por frame
+        key = (roi.shape, color)
+        tint = self._tint_cache.get(key)
+        if tint is None:
+            tint = np.empty(roi.shape, dtype=np.uint8)
+            tint[:] = color
+            self._tint_cache[key] = tint
+        
+        # La mezcla se escribe directo en la región del frame, sin temporal
+        cv2.addWeighted(tint, alpha, roi, 1 - alpha, 0, dst=roi)
+    
+    def _draw_static_text(self, frame, text, origin, scale, color, thickness):
+        """Copia sobre el frame un texto fijo rasterizado una sola vez"""
+        key = (text, scale, thickness)
+        sprite = self._text_sprites.get(key)
+        if sprite is None:
+            (text_width, text_height), baseline = cv2.getTextSize(
+                text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+            )
+            pad = thickness
+            mask = np.zeros(
+                (text_height + baseline + 2 * pad, text_width + 2 * pad), dtype=np.uint8
+            )
+            cv2.putText(mask, text, (pad, pad + text_height),
+                       cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thickness)
+            # Desplazamiento de la esquina superior izquierda respecto al origen de putText
+            sprite = (mask.astype(bool), -pad, -(pad + text_height))
+            self._text_sprites[key] = sprite
+        
+        mask, offset_x, offset_y = sprite
+        x, y = origin[0] + offset_x, origin[1] + offset_y
+        
+        # Recortar a los bordes del frame
+        frame_height, frame_width = frame.shape[:2]
+        x1, y1 = max(x, 0), max(y, 0)
+        x2 = min(x + mask.shape[1], frame_width)
+        y2 = min(y + mask.shape[0], frame_height)
+        if x1 >= x2 or y1 >= y2:
+            return
+        
+        visible = mask[y1 - y:y2 - y, x1 - x:x2 - x]
+        frame[y1:y2, x1:x2][visible] = color
     
     def draw_word_overlay(self, frame, word: str):
         """Dibuja overlay verde cuando detecta palabra completa"""
         try:
             height, width = frame.shape[:2]
-            overlay = frame.copy()
-            
-            cv2.rectangle(
-                overlay, 
-                (10, 10), 
-                (width - 10, 120), 
-                (0, 200, 100),
-                -1
-            )
             
-            cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+            self._blend_rect(frame, (10, 10), (width - 10, 120), (0, 200, 100), 0.7)
             
             cv2.rectangle(
                 frame,
@@ -1008,15 +1312,7 @@ class MainWindow:
                 3
             )
             
-            cv2.putText(
-                frame, 
-                "PALABRA:", 
-                (25, 50),
-                cv2.FONT_HERSHEY_SIMPLEX, 
-                0.8,
-                (255, 255, 255),
-                2
-            )
+            self._draw_static_text(frame, "PALABRA:", (25, 50), 0.8, (255, 255, 255), 2)
             
             cv2.putText(
                 frame, 
@@ -1028,25 +1324,31 @@ class MainWindow:
                 3
             )
             
-            cv2.putText(
-                frame, 
-                "OK", 
-                (width - 80, 75),
-                cv2.FONT_HERSHEY_SIMPLEX, 
-                2.0,
-                (0, 255, 0),
-                4
-            )
+            self._draw_static_text(frame, "OK", (width - 80, 75), 2.0, (0, 255, 0), 4)
             
         except Exception as e:
-            print(f"Error dibujando overlay: {e}")
+            logger.error("Error dibujando overlay: %s", e)
     
     def show_word_gestures_info(self):
         """Muestra ventana con TODAS las palabras completas disponibles"""
+        # Obtener gestos disponibles
+        gestures = self.complete_word_detector.get_available_word_gestures()
+        
+        # Reutilizar la ventana mientras los gestos no hayan cambiado
+        if self._word_gestures_window is not None and self._word_gestures_window.winfo_exists():
+            if gestures == self._word_gestures_snapshot:
+                self._word_gestures_window.deiconify()
+                self._word_gestures_window.lift()
+                return
+            self._word_gestures_window.destroy()
+        
         info_window = tk.Toplevel(self.root)
+        self._word_gestures_window = info_window
+        self._word_gestures_snapshot = dict(gestures)
         info_window.title("⚡ Palabras Completas por Gesto")
         info_window.geometry("900x700")
         info_window.configure(bg='white')
+        info_window.protocol("WM_DELETE_WINDOW", info_window.withdraw)
         
         # Header
         header = tk.Frame(info_window, bg=self.COLORS['primary'], height=70)
@@ -1062,7 +1364,7 @@ class MainWindow:
         
         tk.Label(
             header,
-            text=f"Total: {len(self.complete_word_detector.get_available_word_gestures())} palabras disponibles",
+            text=f"Total: {len(gestures)} palabras disponibles",
             bg=self.COLORS['primary'],
             fg='white',
             font=('Segoe UI', 11)
@@ -1088,77 +1390,17 @@ class MainWindow:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Obtener gestos disponibles
-        gestures = self.complete_word_detector.get_available_word_gestures()
-        
-        # Descripciones organizadas por categorías
-        gesture_categories = {
-            '🤝 SALUDOS Y CORTESÍA': {
-                'THUMBS_UP': ('👍', 'Pulgar arriba'),
-                'WAVE': ('👋', 'Mano oscilando'),
-                'PEACE': ('✌️', 'Dedos en V'),
-                'OK_SIGN': ('👌', 'Círculo OK'),
-                'PRAY_HANDS': ('🙏', 'Manos juntas'),
-                'BOW': ('🙇', 'Reverencia'),
-            },
-            '💬 RESPUESTAS': {
-                'THUMBS_DOWN': ('👎', 'Pulgar abajo'),
-                'NOD_YES': ('✅', 'Asentir'),
-                'SHAKA': ('🤙', 'Shaka'),
-                'FIST_UP': ('✊', 'Puño arriba'),
-            },
-            '🍽️ NECESIDADES': {
-                'POINTING_UP': ('☝️', 'Índice arriba'),
-                'DRINK_GESTURE': ('🥤', 'Beber'),
-                'EAT_GESTURE': ('🍴', 'Comer'),
-                'BATHROOM_SIGN': ('🚽', 'Baño'),
-                'SLEEP_GESTURE': ('😴', 'Dormir'),
-            },
-            '👨‍👩‍👧 FAMILIA': {
-                'HEART_HANDS': ('❤️', 'Corazón con manos'),
-                'MAMA_SIGN': ('👩', 'Mamá'),
-                'PAPA_SIGN': ('👨', 'Papá'),
-                'BABY_ROCK': ('👶', 'Mecer bebé'),
-                'FAMILY_SIGN': ('👨‍👩‍👧', 'Familia'),
-            },
-            '😊 EMOCIONES': {
-                'HAPPY_SIGN': ('😊', 'Sonrisa'),
-                'SAD_SIGN': ('😢', 'Triste'),
-                'ANGRY_FIST': ('😠', 'Puño enojado'),
-                'SCARED_HANDS': ('😨', 'Manos asustadas'),
-                'LOVE_HEART': ('💕', 'Amor'),
-            },
-            '🎯 ACCIONES': {
-                'CALL_ME': ('📞', 'Llámame'),
-                'COME_HERE': ('👈', 'Ven aquí'),
-                'GO_AWAY': ('👉', 'Vete'),
-                'WAIT_HAND': ('✋', 'Espera'),
-                'STOP_HAND': ('🛑', 'Alto'),
-            },
-            '📍 LUGARES': {
-                'HOME_SIGN': ('🏠', 'Casa'),
-                'SCHOOL_SIGN': ('🏫', 'Escuela'),
-                'WORK_SIGN': ('💼', 'Trabajo'),
-                'HOSPITAL_CROSS': ('🏥', 'Hospital'),
-            },
-            '⏰ TIEMPO': {
-                'NOW_SIGN': ('⏰', 'Ahora'),
-                'LATER_SIGN': ('🕐', 'Después'),
-                'TODAY_SIGN': ('📅', 'Hoy'),
-                'TOMORROW_POINT': ('➡️', 'Mañana'),
-            },
-            '💼 ÚTILES': {
-                'PHONE_CALL': ('📱', 'Teléfono'),
-                'WRITE_SIGN': ('✍️', 'Escribir'),
-                'READ_SIGN': ('📖', 'Leer'),
-                'LISTEN_EAR': ('👂', 'Escuchar'),
-                'MONEY_RUB': ('💰', 'Dinero'),
-                'FRIEND_LINK': ('🤝', 'Amigo'),
-            },
-        }
         
-        # Mostrar por categorías
-        for category_name, category_gestures in gesture_categories.items():
+        # Mostrar por categorías, saltando las que no tienen gestos disponibles
+        for category_name, category_gestures in _GESTURE_CATEGORIES.items():
+            available = [
+                (emoji, description, gestures[gesture_type])
+                for gesture_type, (emoji, description) in category_gestures.items()
+                if gestures.get(gesture_type)
+            ]
+            if not available:
+                continue
+            
             # Header de categoría
             category_header = tk.Frame(scrollable_frame, bg=self.COLORS['primary'], height=40)
             category_header.pack(fill=tk.X, pady=(10, 5))
@@ -1171,62 +1413,54 @@ class MainWindow:
                 font=('Segoe UI', 12, 'bold')
             ).pack(pady=8)
             
-            # Gestos de la categoría
-            for gesture_type, (emoji, description) in  category_gestures.items():
-                word = gestures.get(gesture_type)
+            # Gestos disponibles de la categoría
+            for emoji, description, word in available:
+                gesture_frame = tk.Frame(scrollable_frame, bg=self.COLORS['bg_light'], 
+                                        relief='raised', bd=1)
+                gesture_frame.pack(fill=tk.X, pady=2, padx=10)
                 
-                if word:  # Solo mostrar si el gesto está disponible
-                    gesture_frame = tk.Frame(scrollable_frame, bg=self.COLORS['bg_light'], 
-                                            relief='raised', bd=1)
-                    gesture_frame.pack(fill=tk.X, pady=2, padx=10)
-                    
-                    tk.Label(
-                        gesture_frame,
-                        text=f"{emoji}  {description}",
-                        bg=self.COLORS['bg_light'],
-                        fg=self.COLORS['text_dark'],
-                        font=('Segoe UI', 10),
-                        width=25,
-                        anchor='w'
-                    ).pack(side=tk.LEFT, padx=10, pady=6)
-                    
-                    tk.Label(
-                        gesture_frame,
-                        text="→",
-                        bg=self.COLORS['bg_light'],
-                        fg=self.COLORS['primary'],
-                        font=('Segoe UI', 12, 'bold')
-                    ).pack(side=tk.LEFT, padx=5)
-                    
-                    tk.Label(
-                        gesture_frame,
-                        text=word,
-                        bg=self.COLORS['bg_light'],
-                        fg=self.COLORS['primary'],
-                        font=('Segoe UI', 11, 'bold')
-                    ).pack(side=tk.LEFT, padx=10)
+                tk.Label(
+                    gesture_frame,
+                    text=f"{emoji}  {description}",
+                    bg=self.COLORS['bg_light'],
+                    fg=self.COLORS['text_dark'],
+                    font=('Segoe UI', 10),
+                    width=25,
+                    anchor='w'
+                ).pack(side=tk.LEFT, padx=10, pady=6)
+                
+                tk.Label(
+                    gesture_frame,
+                    text="→",
+                    bg=self.COLORS['bg_light'],
+                    fg=self.COLORS['primary'],
+                    font=('Segoe UI', 12, 'bold')
+                ).pack(side=tk.LEFT, padx=5)
+                
+                tk.Label(
+                    gesture_frame,
+                    text=word,
+                    bg=self.COLORS['bg_light'],
+                    fg=self.COLORS['primary'],
+                    font=('Segoe UI', 11, 'bold')
+                ).pack(side=tk.LEFT, padx=10)
         
         # Footer con botón cerrar
         footer = tk.Frame(info_window, bg='white', height=60)
         footer.pack(fill=tk.X, side=tk.BOTTOM)
         
-        tk.Button(
+        ttk.Button(
             footer,
             text="Entendido",
-            command=info_window.destroy,
-            bg=self.COLORS['primary'],
-            fg='white',
-            font=('Segoe UI', 11, 'bold'),
-            relief='flat',
-            padx=30,
-            pady=10,
-            cursor='hand2'
+            command=info_window.withdraw,
+            cursor='hand2',
+            style='Confirm.TButton'
         ).pack(pady=15)
     
     def toggle_auto_add(self):
         self.auto_add_enabled = self.auto_add_var.get()
         status = "activado" if self.auto_add_enabled else "desactivado"
-        self.status_var.set(f"✓ Auto-agregado {status}")
+        self._set_status(f"✓ Auto-agregado {status}")
     
     def update_auto_add_speed(self, value):
         speed = int(float(value))
@@ -1239,17 +1473,19 @@ class MainWindow:
     
     def show_precision_manager(self):
         try:
-            from .precision_manager import PrecisionManager
-            manager = PrecisionManager(self, self.gesture_calibrator)
-            manager.show_precision_window()
+            if self._precision_manager is None:
+                from .precision_manager import PrecisionManager
+                self._precision_manager = PrecisionManager(self, self.gesture_calibrator)
+            self._precision_manager.show_precision_window()
         except ImportError as e:
             messagebox.showerror("Error", f"No se pudo cargar: {e}")
     
     def show_reference_gallery(self):
         try:
-            from .reference_gallery import ReferenceGallery
-            gallery = ReferenceGallery(self)
-            gallery.show_gallery()
+            if self._reference_gallery is None:
+                from .reference_gallery import ReferenceGallery
+                self._reference_gallery = ReferenceGallery(self)
+            self._reference_gallery.show_gallery()
         except ImportError as e:
             messagebox.showerror("Error", f"No se pudo cargar: {e}")
     
@@ -1270,63 +1506,84 @@ class MainWindow:
             font=('Segoe UI', 18, 'bold')
         ).pack(pady=15)
         
-        letters_container = tk.Frame(letters_window, bg='white')
-        letters_container.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
-        
-        row, col = 0, 0
-        for i, letter in enumerate(Config.SUPPORTED_LETTERS):
-            letter_frame = tk.Frame(
-                letters_container,
-                bg=self.COLORS['secondary'],
-                relief='raised',
-                bd=2
+        # Todo el alfabeto en un solo Canvas: un rectángulo y un texto por
+        # letra en lugar de un Frame y un Label
+        letters_canvas = tk.Canvas(letters_window, bg='white', highlightthickness=0)
+        letters_canvas.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
+        
+        cells = []
+        for letter in Config.SUPPORTED_LETTERS:
+            rect_id = letters_canvas.create_rectangle(
+                0, 0, 0, 0,
+                fill=self.COLORS['secondary'],
+                outline=self.COLORS['hover'],
+                width=2
             )
-            letter_frame.grid(row=row, column=col, padx=8, pady=8, sticky='nsew')
-            
-            tk.Label(
-                letter_frame,
+            text_id = letters_canvas.create_text(
+                0, 0,
                 text=letter,
                 font=('Arial', 24, 'bold'),
-                bg=self.COLORS['secondary'],
-                fg='white',
-                width=2,
-                height=1
-            ).pack(padx=10, pady=10)
-            
-            col += 1
-            if col >= 7:
-                col = 0
-                row += 1
+                fill='white'
+            )
+            cells.append((rect_id, text_id))
         
-        for i in range(7):
-            letters_container.columnconfigure(i, weight=1)
+        letters_canvas.bind(
+            '<Configure>',
+            lambda e: self._layout_letter_cells(letters_canvas, cells, e.width)
+        )
         
-        tk.Button(
+        ttk.Button(
             letters_window,
             text="Cerrar",
             command=letters_window.destroy,
-            bg=self.COLORS['danger'],
-            fg='white',
-            font=('Segoe UI', 11),
-            relief='flat',
-            padx=30,
-            pady=10,
-            cursor='hand2'
+            cursor='hand2',
+            style='DialogClose.TButton'
         ).pack(pady=20)
     
+    def _layout_letter_cells(self, canvas, cells, width, columns=7, gap=16, cell_height=72):
+        """Reparte las celdas de letras en columnas de igual ancho"""
+        cell_width = max(1, (width - gap * (columns - 1)) // columns)
+        for i, (rect_id, text_id) in enumerate(cells):
+            row, col = divmod(i, columns)
+            x = col * (cell_width + gap)
+            y = row * (cell_height + gap)
+            canvas.coords(rect_id, x, y, x + cell_width, y + cell_height)
+            canvas.coords(text_id, x + cell_width / 2, y + cell_height / 2)
+    
     def setup_camera(self):
         try:
-            self.cap = cv2.VideoCapture(Config.CAMERA_INDEX)
+            self.cap = self._open_camera()
+            
+            # El FOURCC va antes de la resolución: el driver negocia ambos juntos
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*Config.CAMERA_FOURCC))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, Config.CAMERA_WIDTH)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.CAMERA_HEIGHT)
+            self.cap.set(cv2.CAP_PROP_FPS, Config.CAMERA_FPS)
+            # Sin cola en el driver: siempre se lee el frame más reciente
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, Config.BUFFER_SIZE)
             
             if not self.cap.isOpened():
                 raise Exception("No se pudo abrir la cámara")
             
-            self.status_var.set("✓ Cámara configurada")
+            self._set_status("✓ Cámara configurada")
         except Exception as e:
             messagebox.showerror("Error", f"Error cámara: {e}")
-            self.status_var.set("✗ Error en cámara")
+            self._set_status("✗ Error en cámara")
+    
+    def _open_camera(self):
+        """Abre la cámara con el backend nativo de la plataforma si está disponible"""
+        if sys.platform.startswith('win'):
+            backend = cv2.CAP_DSHOW
+        elif sys.platform.startswith('linux'):
+            backend = cv2.CAP_V4L2
+        else:
+            backend = cv2.CAP_ANY
+        
+        cap = cv2.VideoCapture(Config.CAMERA_INDEX, backend)
+        if not cap.isOpened() and backend != cv2.CAP_ANY:
+            cap.release()
+            cap = cv2.VideoCapture(Config.CAMERA_INDEX)
+        return cap
     
     def toggle_detection(self):
         if not self.is_running:
@@ -1340,39 +1597,100 @@ class MainWindow:
             return
         
         self.is_running = True
-        self.start_button.config(text="⏸ Detener", bg=self.COLORS['danger'])
-        self.status_var.set("🔴 Detectando gestos...")
+        self.start_button.config(text="⏸ Detener", style='Stop.TButton')
+        self._set_status("🔴 Detectando gestos...")
+        
+        with self._frame_lock:
+            self._latest_frame = None
+            self._frame_ready.clear()
         
-        detection_thread = threading.Thread(target=self.detection_loop)
-        detection_thread.daemon = True
-        detection_thread.start()
+        self._miss_streak = 0
+        self._detect_stride = 1
+        
+        self._capture_thread = threading.Thread(target=self._capture_loop)
+        self._capture_thread.daemon = True
+        self._capture_thread.start()
+        
+        self._detection_thread = threading.Thread(target=self.detection_loop)
+        self._detection_thread.daemon = True
+        self._detection_thread.start()
     
     def stop_detection(self):
         self.is_running = False
-        self.start_button.config(text="▶ Iniciar Detección", bg=self.COLORS['primary'])
-        self.status_var.set("✓ Detección detenida")
+        self.start_button.config(text="▶ Iniciar Detección", style='Start.TButton')
+        self._set_status("✓ Detección detenida")
+    
+    def _capture_loop(self):
+        """Lee la cámara sin pausa y deja solo el último frame disponible"""
+        while self.is_running:
+            ret, frame = self.cap.read()
+            if not ret:
+                continue
+            
+            # El espejo se aplica aquí, en paralelo con la inferencia del frame anterior
+            frame = cv2.flip(frame, 1)
+            
+            with self._frame_lock:
+                self._latest_frame = frame
+                self._frame_ready.set()
+    
+    def _take_latest_frame(self, timeout: float = 0.1):
+        """Toma el frame más reciente (o None si no llegó ninguno a tiempo)"""
+        if not self._frame_ready.wait(timeout):
+            return None
+        
+        with self._frame_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+            self._frame_ready.clear()
+        return frame
     
     def detection_loop(self):
         """BUCLE PRINCIPAL - Palabras Completas + Sílabas + Letras"""
         while self.is_running:
             try:
-                ret, frame = self.cap.read()
-                if not ret:
+                frame = self._take_latest_frame()
+                if frame is None:
+                    continue
+                
+                # Sin mano reciente: el video sigue fluido pero la inferencia se espacia
+                self._frame_ix += 1
+                if self._frame_ix % self._detect_stride:
+                    # Mismo ajuste de iluminación que los frames detectados: sin parpadeo
+                    self._publish_result(self.hand_detector.preprocess_frame(frame), None,
+                                         self._empty_hands_data(), None)
                     continue
                 
-                frame = cv2.flip(frame, 1)
                 processed_frame, hands_data = self.hand_detector.detect_hands(frame)
                 
+                if hands_data['landmarks_list']:
+                    self._miss_streak = 0
+                    self._detect_stride = 1
+                else:
+                    self._miss_streak += 1
+                    if self._miss_streak >= self.idle_miss_frames:
+                        self._detect_stride = self.idle_detect_stride
+                
                 detected_result = None
                 control_result = None
                 complete_word_result = None
                 
+                # Cada mano se convierte a un arreglo (21, 3) una sola vez; los
+                # clasificadores reutilizan las características de ese arreglo
+                landmarks_arrays = [
+                    np.asarray(landmarks[:63], dtype=np.float64).reshape(21, 3)
+                    for landmarks in hands_data['landmarks_list']
+                    if len(landmarks) >= 63
+                ]
+                
                 # PRIORIDAD 1: PALABRAS COMPLETAS
-                if (self.complete_word_mode_enabled and 
-                    hands_data['landmarks_list'] and 
-                    len(hands_data['landmarks_list']) > 0):
+                if self.complete_word_mode_enabled and not landmarks_arrays:
+                    # Un gesto interrumpido no debe completarse al volver la mano
+                    self.complete_word_detector.hand_lost()
+                
+                if self.complete_word_mode_enabled and landmarks_arrays:
                     
-                    landmarks = hands_data['landmarks_list'][0]
+                    landmarks = landmarks_arrays[0]
                     confidence = hands_data.get('confidence', {}).get('left', 0) or \
                                hands_data.get('confidence', {}).get('right', 0)
                     
@@ -1382,14 +1700,14 @@ class MainWindow:
                     )
                     
                     if complete_word_result:
-                        self.process_complete_word(complete_word_result)
+                        self._event_queue.put(('word', complete_word_result))
                         self.draw_word_overlay(processed_frame, complete_word_result)
-                        self.update_ui(processed_frame, None, hands_data, None)
+                        self._publish_result(processed_frame, None, hands_data, None)
                         continue
                 
                 # PRIORIDAD 2: GESTOS DE CONTROL
-                if hands_data['landmarks_list']:
-                    for landmarks in hands_data['landmarks_list']:
+                if landmarks_arrays:
+                    for landmarks in landmarks_arrays:
                         control_gesture = self.gesture_classifier.detect_control_gesture(landmarks)
                         
                         if control_gesture:
@@ -1399,7 +1717,7 @@ class MainWindow:
                             )
                             
                             if control_result:
-                                self.execute_control_gesture(control_result)
+                                self._event_queue.put(('control', control_result))
                                 break
                 
                 # PRIORIDAD 3: LETRAS/SÍLABAS
@@ -1411,61 +1729,101 @@ class MainWindow:
                                 hands_data['right']
                             )
                     elif self.detection_mode == "letters":
-                        if hands_data['landmarks_list']:
-                            for landmarks in hands_data['landmarks_list']:
+                        if landmarks_arrays:
+                            for landmarks in landmarks_arrays:
                                 letter = self.gesture_classifier.predict_gesture(landmarks)
                                 if letter:
                                     detected_result = letter
                                     confidence = hands_data.get('confidence', {}).get('left', 0) or \
                                                hands_data.get('confidence', {}).get('right', 0)
-                                    self.gesture_calibrator.collect_sample(letter, landmarks, confidence)
+                                    self.gesture_calibrator.collect_sample(letter, landmarks.ravel().tolist(), confidence)
                                     break
                 
-                self.update_ui(processed_frame, detected_result, hands_data, control_result)
+                self._publish_result(processed_frame, detected_result, hands_data, control_result)
                 
             except Exception as e:
-                print(f"Error en detección: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error en detección: %s", e)
                 continue
     
-    def update_ui(self, frame, detected_result, hands_data, control_result=None):
+    @staticmethod
+    def _empty_hands_data() -> Dict:
+        """Resultado de detección sin manos, con la forma que devuelve detect_hands"""
+        return {'left': None, 'right': None, 'landmarks_list': []}
+    
+    def _publish_result(self, frame, detected_result, hands_data, control_result):
+        """Deja el último resultado para la interfaz, descartando el anterior"""
+        result = (frame, detected_result, hands_data, control_result)
         try:
-            label_width = self.video_label.winfo_width()
-            label_height = self.video_label.winfo_height()
-            
-            if label_width <= 1:
-                label_width = 640
-                label_height = 480
+            self._result_queue.put_nowait(result)
+        except queue.Full:
+            try:
+                self._result_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._result_queue.put_nowait(result)
+        
+        self._notify_ui()
+    
+    def _notify_ui(self):
+        """Despierta al hilo de Tk con un evento virtual, uno pendiente a la vez"""
+        if self._ui_notify_pending.is_set():
+            return
+        self._ui_notify_pending.set()
+        try:
+            self.root.event_generate('<<Detection>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            # La ventana se está cerrando
+            self._ui_notify_pending.clear()
+    
+    def _apply_results(self, event=None):
+        """Aplica en el hilo de Tk los eventos y el último frame procesado"""
+        # Limpiar antes de vaciar: lo que llegue durante el vaciado genera otro aviso
+        self._ui_notify_pending.clear()
+        
+        while True:
+            try:
+                kind, value = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
             
+            if kind == 'word':
+                self.process_complete_word(value)
+            elif kind == 'control':
+                self.execute_control_gesture(value)
+        
+        try:
+            result = self._result_queue.get_nowait()
+        except queue.Empty:
+            result = None
+        
+        if result is not None:
+            self.update_ui(*result)
+    
+    def update_ui(self, frame, detected_result, hands_data, control_result=None):
+        try:
             frame_height, frame_width = frame.shape[:2]
-            aspect_ratio = frame_width / frame_height
-            
-            if label_width / label_height > aspect_ratio:
-                new_height = label_height
-                new_width = int(new_height * aspect_ratio)
-            else:
-                new_width = label_width
-                new_height = int(new_width / aspect_ratio)
+            new_width, new_height = self._fit_video_size(frame_width, frame_height)
             
             if control_result and self.show_control_feedback:
-                overlay = frame.copy()
-                cv2.rectangle(overlay, (10, 10), (300, 80), (0, 100, 255), -1)
-                cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+                self._blend_rect(frame, (10, 10), (300, 80), (0, 100, 255), 0.7)
                 
                 control_name = self.gesture_controls.get_control_name(control_result)
                 cv2.putText(frame, control_name, (20, 55),
                            cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 3)
             
-            frame_resized = cv2.resize(frame, (new_width, new_height), 
-                                      interpolation=cv2.INTER_AREA)
-            
-            frame_rgb = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
-            frame_pil = Image.fromarray(frame_rgb)
-            frame_tk = ImageTk.PhotoImage(frame_pil)
+            # Si el frame ya tiene el tamaño de destino no hay nada que escalar
+            if (new_width, new_height) == (frame_width, frame_height):
+                frame_resized = frame
+            else:
+                interpolation = cv2.INTER_AREA if new_width < frame_width else cv2.INTER_LINEAR
+                # Destino reutilizado mientras no cambie el tamaño del video
+                if self._resize_buffer is None or self._resize_buffer.shape[:2] != (new_height, new_width):
+                    self._resize_buffer = np.empty((new_height, new_width, 3), dtype=np.uint8)
+                frame_resized = cv2.resize(frame, (new_width, new_height), 
+                                          dst=self._resize_buffer,
+                                          interpolation=interpolation)
             
-            self.video_label.configure(image=frame_tk)
-            self.video_label.image = frame_tk
+            self._show_video_frame(frame_resized)
             
             if self.auto_add_enabled and detected_result and not control_result:
                 self.handle_auto_add_logic(detected_result)
@@ -1476,54 +1834,191 @@ class MainWindow:
                 self.update_letter_display(detected_result)
             
         except Exception as e:
-            print(f"Error actualizando UI: {e}")
+            logger.exception("Error actualizando UI: %s", e)
+    
+    def _fit_video_size(self, frame_width, frame_height):
+        """Tamaño que encaja el frame en el canvas, recalculado solo si algo cambia"""
+        label_width, label_height = self._video_canvas_size
+        
+        if label_width <= 1:
+            label_width = 640
+            label_height = 480
+        
+        key = (label_width, label_height, frame_width, frame_height)
+        if key != self._video_fit_key:
+            aspect_ratio = frame_width / frame_height
+            
+            if label_width / label_height > aspect_ratio:
+                new_height = label_height
+                new_width = int(new_height * aspect_ratio)
+            else:
+                new_width = label_width
+                new_height = int(new_width / aspect_ratio)
+            
+            self._video_fit_key = key
+            self._video_fit_size = (new_width, new_height)
+        
+        return self._video_fit_size
+    
+    def _show_video_frame(self, frame_bgr):
+        """Copia el frame en la PhotoImage existente en lugar de crear otra"""
+        height, width = frame_bgr.shape[:2]
+        if self._rgb_buffer is None or self._rgb_buffer.shape[:2] != (height, width):
+            # La imagen PIL comparte memoria con el buffer: sin copias intermedias.
+            # Pillow solo mapea el buffer en modos de 4 bytes como RGBX; con 'RGB'
+            # frombuffer copia los datos y la imagen no vería los frames nuevos
+            self._rgb_buffer = np.empty((height, width, 4), dtype=np.uint8)
+            self._rgb_image = Image.frombuffer(
+                'RGBX', (width, height), self._rgb_buffer, 'raw', 'RGBX', 0, 1
+            )
+            self._video_photo = None
+        
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGBA, dst=self._rgb_buffer)
+        
+        if self._video_photo is None:
+            self._video_photo = ImageTk.PhotoImage(self._rgb_image)
+            self.video_canvas.itemconfig(self._video_image_id, image=self._video_photo)
+            self.video_canvas.itemconfig(self._video_text_id, state='hidden')
+        else:
+            self._video_photo.paste(self._rgb_image)
+    
+    def _on_video_canvas_resize(self, event):
+        """Guarda el tamaño del canvas de video y centra sus items"""
+        self._video_canvas_size = (event.width, event.height)
+        center_x, center_y = event.width // 2, event.height // 2
+        self.video_canvas.coords(self._video_image_id, center_x, center_y)
+        self.video_canvas.coords(self._video_text_id, center_x, center_y)
+    
+    def _set_status(self, message: str):
+        """Actualiza la barra de estado solo si el mensaje cambia"""
+        if message != self._last_status:
+            self._last_status = message
+            self.status_var.set(message)
+    
+    def _schedule_status_reset(self, delay: int):
+        """Vuelve al estado de detección tras `delay` ms; reemplaza el pendiente"""
+        if self._status_reset_id is not None:
+            self.root.after_cancel(self._status_reset_id)
+        self._status_reset_id = self.root.after(delay, self._reset_status_if_running)
+    
+    def _reset_status_if_running(self):
+        """Restablece la barra de estado si la detección sigue activa"""
+        self._status_reset_id = None
+        if self.is_running:
+            self._set_status("🔴 Detectando gestos...")
+    
+    def _mark_ui(self, key, value):
+        """Registra un cambio de la interfaz y agenda un único volcado en idle"""
+        self._ui_dirty[key] = value
+        if self._ui_flush_id is None:
+            self._ui_flush_id = self.root.after_idle(self._flush_ui)
+    
+    def _flush_ui(self):
+        """Aplica de una vez los cambios pendientes, omitiendo los que no cambian nada"""
+        self._ui_flush_id = None
+        dirty, self._ui_dirty = self._ui_dirty, {}
+        
+        shown = self._shown_ui
+        
+        letter = dirty.get('letter')
+        if letter is not None and letter != shown.get('letter'):
+            shown['letter'] = letter
+            self.letter_var.set(letter)
+        
+        counter = dirty.get('counter')
+        if counter is not None and counter != shown.get('counter'):
+            shown['counter'] = counter
+            self.detection_counter_var.set(counter)
+        
+        confidence = dirty.get('confidence')
+        if confidence is not None:
+            text = f"{confidence:.1f}%"
+            if text != shown.get('confidence'):
+                shown['confidence'] = text
+                self.confidence_var.set(confidence)
+                self.confidence_label.config(text=text)
+            self.update_confidence_bar(confidence)
     
     def update_letter_display(self, detected_letter):
+        # La letra detectada sigue al clasificador (la usa "+ Letra");
+        # la histéresis solo decide qué se muestra en pantalla
+        counter_text = None
         if detected_letter and detected_letter != self.detected_letter:
             self.detected_letter = detected_letter
-            self.letter_var.set(detected_letter)
             self.detection_count += 1
-            self.detection_counter_var.set(f"Detecciones: {self.detection_count}")
-        elif not detected_letter:
-            self.letter_var.set("-")
+            counter_text = f"Detecciones: {self.detection_count}"
+        
+        confidence = self.gesture_classifier.get_detection_confidence() if detected_letter else 0.0
+        text = None
+        if not self._update_display_hysteresis(detected_letter, confidence * 100):
+            text = "-"
+        elif detected_letter:
+            text = detected_letter
         
-        confidence = self.gesture_classifier.get_detection_confidence()
-        self.confidence_var.set(confidence * 100)
-        self.confidence_label.config(text=f"{confidence*100:.1f}%")
-        self.update_confidence_bar(confidence * 100)
+        self._apply_detection_state(text, counter_text)
     
     def update_syllable_display(self, detected_syllable, hands_data):
         """Actualiza el display cuando se detecta una sílaba - CORREGIDO"""
+        counter_text = None
         if detected_syllable and detected_syllable != self.detected_syllable:
             # IMPORTANTE: Actualizar la variable de instancia
             self.detected_syllable = detected_syllable
             
-            # Actualizar el label con la sílaba
-            self.letter_var.set(detected_syllable)
-            
             # Incrementar contador
             self.detection_count += 1
-            self.detection_counter_var.set(f"Sílabas: {self.detection_count}")
-            
-            print(f"[DEBUG] Sílaba detectada y mostrada: {detected_syllable}")
+            counter_text = f"Sílabas: {self.detection_count}"
             
+            logger.debug("Sílaba detectada: %s", detected_syllable)
         elif not detected_syllable:
+            # Limpiar la variable si no hay detección
+            self.detected_syllable = ""
+        
+        confidence = self.syllable_classifier.get_detection_confidence() if detected_syllable else 0.0
+        text = None
+        if not self._update_display_hysteresis(detected_syllable, confidence * 100):
             # Si no hay detección, mostrar estado de las manos
             left_status = "✓" if hands_data.get('left') else "✗"
             right_status = "✓" if hands_data.get('right') else "✗"
-            self.letter_var.set(f"L:{left_status} R:{right_status}")
-            
-            # Limpiar la variable si no hay detección
-            self.detected_syllable = ""
+            text = f"L:{left_status} R:{right_status}"
+        elif detected_syllable:
+            text = detected_syllable
         
-        # Actualizar barra de confianza
-        confidence = self.syllable_classifier.get_detection_confidence()
-        self.confidence_var.set(confidence * 100)
-        self.confidence_label.config(text=f"{confidence*100:.1f}%")
-        self.update_confidence_bar(confidence * 100)
+        self._apply_detection_state(text, counter_text)
+    
+    def _apply_detection_state(self, text, counter_text):
+        """Registra texto, contador y confianza en el mismo volcado de la interfaz"""
+        if text is not None:
+            self._mark_ui('letter', text)
+        if counter_text is not None:
+            self._mark_ui('counter', counter_text)
+        self._mark_ui('confidence', self._confidence_ema)
+    
+    def _update_display_hysteresis(self, detected, confidence) -> bool:
+        """
+        Actualiza las EMAs del frame e indica si debe mostrarse una detección.
+        La barra usa la confianza suavizada; la letra en pantalla usa la
+        fracción suavizada de frames con detección, con umbrales de entrada y
+        salida. Sin detección (o sin mano) el historial del clasificador no
+        avanza y su confianza queda congelada: a ambas EMAs entra 0.
+        """
+        alpha = self.confidence_smoothing
+        self._confidence_ema += alpha * (confidence - self._confidence_ema)
+        self._detection_presence += alpha * ((1.0 if detected else 0.0) - self._detection_presence)
+        
+        if self._detection_shown:
+            if self._detection_presence < self.display_exit_threshold:
+                self._detection_shown = False
+        elif detected and self._detection_presence > self.display_enter_threshold:
+            self._detection_shown = True
+        return self._detection_shown
     
     def handle_auto_add_logic(self, detected_result):
         """Maneja auto-agregado para LETRAS Y SÍLABAS - CORREGIDO"""
+        now = time.monotonic()
+        if now - self._last_auto_add_time < self.auto_add_min_interval:
+            return
+        self._last_auto_add_time = now
+        
         if self.cooldown_count > 0:
             self.cooldown_count -= 1
             return
@@ -1578,7 +2073,7 @@ class MainWindow:
         """Borra la última letra usando el gestor"""
         if self.word_sentence_manager.delete_last_letter():
             self.update_text_display()
-            self.status_var.set("⌫ Letra borrada")
+            self._set_status("⌫ Letra borrada")
     
     def toggle_pause_detection(self):
         """Pausa/reanuda la detección temporalmente"""
@@ -1589,11 +2084,18 @@ class MainWindow:
 
     def on_text_change(self, event=None):
         """Callback cuando cambia el texto"""
+        # Las teclas que llegan mientras hay un cambio pendiente se agrupan en él
+        if self._text_change_after_id is None:
+            self._text_change_after_id = self.root.after(16, self._apply_text_change)
+    
+    def _apply_text_change(self):
+        """Procesa los cambios de texto acumulados"""
+        self._text_change_after_id = None
+        # El widget se editó a mano: forzar resincronización en el próximo refresco
+        self._last_current_word = None
+        self._last_sentence = None
         if self.suggestions_enabled:
-            if hasattr(self, '_suggestion_timer'):
-                self.root.after_cancel(self._suggestion_timer)
-            
-            self._suggestion_timer = self.root.after(500, self.update_suggestions)
+            self.update_suggestions()
     
     def on_text_modified(self, event=None):
         """Callback cuando se modifica el texto"""
@@ -1604,119 +2106,139 @@ class MainWindow:
         try:
             current_word = self.word_sentence_manager.get_current_word()
             
+            # Misma palabra y la lista mostrada es la que se calculó para ella
+            if (current_word == self._last_suggest_word and
+                    self.current_suggestions is self._last_suggestions):
+                return
+            
             if current_word and len(current_word) >= 2:
                 self.current_suggestions = self.word_suggester.update_current_word(current_word)
             else:
                 self.current_suggestions = []
             
+            self._last_suggest_word = current_word
+            self._last_suggestions = self.current_suggestions
             self.update_suggestion_buttons()
             
         except Exception as e:
-            print(f"Error actualizando sugerencias: {e}")
+            logger.error("Error actualizando sugerencias: %s", e)
+    
+    def _schedule_suggestions(self, delay: int = 120):
+        """Agenda el recálculo de sugerencias; una ráfaga de letras produce uno solo"""
+        if self._suggest_after_id is not None:
+            self.root.after_cancel(self._suggest_after_id)
+        self._suggest_after_id = self.root.after(delay, self._run_suggestions)
+    
+    def _run_suggestions(self):
+        """Ejecuta el recálculo agendado por _schedule_suggestions"""
+        self._suggest_after_id = None
+        self.update_suggestions()
     
     def apply_suggestion(self, suggestion: str):
         """Aplica una sugerencia seleccionada"""
         self.word_sentence_manager.clear_current_word()
-        
-        for letter in suggestion:
-            self.word_sentence_manager.add_letter(letter)
+        self.word_sentence_manager.add_word(suggestion)
         
         self.update_text_display()
-        self.status_var.set(f"✓ Sugerencia aplicada: {suggestion}")
+        self._set_status(f"✓ Sugerencia aplicada: {suggestion}")
     
     def apply_quick_word(self, word: str):
         """Aplica una palabra rápida"""
         self.word_sentence_manager.clear_current_word()
-        
-        for letter in word:
-            self.word_sentence_manager.add_letter(letter)
+        self.word_sentence_manager.add_word(word)
         
         self.word_sentence_manager.add_space()
         self.update_text_display()
-        self.status_var.set(f"✓ Palabra rápida agregada: {word}")
+        self._set_status(f"✓ Palabra rápida agregada: {word}")
     
     def apply_phrase(self, phrase: str):
         """Aplica una frase completa"""
         if self.word_sentence_manager.add_complete_sentence(phrase):
             self.update_text_display()
-            self.status_var.set(f"✓ Frase agregada: {phrase}")
+            self._set_status(f"✓ Frase agregada: {phrase}")
     
     def update_suggestion_buttons(self):
         """Actualiza los botones de sugerencias"""
-        for widget in self.suggestions_frame.winfo_children():
-            widget.destroy()
-        
-        if self.current_suggestions and len(self.current_suggestions) > 0:
-            for i, suggestion in enumerate(self.current_suggestions[:5]):
-                btn = tk.Button(
-                    self.suggestions_frame,
-                    text=suggestion,
-                    command=lambda s=suggestion: self.apply_suggestion(s),
-                    bg=self.COLORS['secondary'],
-                    fg='white',
-                    font=('Segoe UI', 9),
-                    relief='flat',
-                    padx=12,
-                    pady=5,
-                    cursor='hand2'
-                )
-                btn.pack(side=tk.LEFT, padx=3, pady=2)
-                btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.COLORS['hover']))
-                btn.bind('<Leave>', lambda e, b=btn: b.config(bg=self.COLORS['secondary']))
-        else:
-            tk.Label(
-                self.suggestions_frame,
-                text="Escribe para ver sugerencias...",
-                bg='white',
-                fg=self.COLORS['border'],
-                font=('Segoe UI', 9, 'italic')
-            ).pack(pady=5)
+        suggestions = self.current_suggestions[:self.MAX_SUGGESTION_BUTTONS]
+        
+        # Misma lista ya mostrada (p. ej. vaciar algo que ya estaba vacío)
+        rendered = tuple(suggestions)
+        if rendered == self._last_rendered_suggestions:
+            return
+        self._last_rendered_suggestions = rendered
+        
+        if suggestions:
+            self._suggestions_empty_label.pack_forget()
+        elif not self._suggestions_empty_label.winfo_manager():
+            self._suggestions_empty_label.pack(pady=5)
+        
+        # Los botones visibles siempre son los primeros del pool, así el orden
+        # de empaquetado se conserva al mostrar u ocultar los del final
+        for i, btn in enumerate(self._suggestion_buttons):
+            if i < len(suggestions):
+                suggestion = suggestions[i]
+                if suggestion != self._suggestion_slots[i]:
+                    self._suggestion_slots[i] = suggestion
+                    btn.config(text=suggestion)
+                if not btn.winfo_manager():
+                    btn.pack(side=tk.LEFT, padx=3, pady=2)
+            elif btn.winfo_manager():
+                self._suggestion_slots[i] = None
+                btn.pack_forget()
+    
+    def _apply_suggestion_slot(self, index: int):
+        """Aplica la sugerencia que muestra actualmente el botón del pool"""
+        suggestion = self._suggestion_slots[index]
+        if suggestion:
+            self.apply_suggestion(suggestion)
     
     def show_control_feedback_message(self, message: str):
         """Muestra mensaje de feedback"""
         self.control_feedback_text = message
         self.show_control_feedback = True
-        self.status_var.set(message)
-        self.root.after(2000, self.hide_control_feedback)
+        self._set_status(message)
+        if self._control_feedback_after_id is not None:
+            self.root.after_cancel(self._control_feedback_after_id)
+        self._control_feedback_after_id = self.root.after(2000, self.hide_control_feedback)
     
     def hide_control_feedback(self):
         """Oculta el mensaje de feedback"""
+        self._control_feedback_after_id = None
         self.show_control_feedback = False
         if self.is_running:
-            self.status_var.set("🔴 Detectando gestos...")
+            self._set_status("🔴 Detectando gestos...")
     
     def auto_add_space(self):
-        current_text = self.word_text.get(1.0, tk.END)
-        if current_text and current_text[-2] != " ":
+        # Solo el último carácter (sin el salto de línea final de Tk), no todo el texto
+        last_char = self.word_text.get('end-2c', 'end-1c')
+        if last_char and last_char != " ":
             self.word_text.insert(tk.END, " ")
             self.word_text.see(tk.END)
-            self.status_var.set("✓ Auto-espacio agregado")
+            self._last_sentence = None
+            self._set_status("✓ Auto-espacio agregado")
     
     def auto_add_letter(self, letter):
         """Auto-agrega letra O SÍLABA - CORREGIDO"""
         if letter and letter != "-":
             # Verificar si es una sílaba (más de 1 carácter) o una letra
             if len(letter) > 1:
-                # Es una sílaba - agregar cada letra
-                print(f"[DEBUG] Auto-agregando SÍLABA: {letter}")
-                for char in letter:
-                    if self.word_sentence_manager.add_letter(char):
-                        print(f"[DEBUG] Letra '{char}' agregada de sílaba '{letter}'")
+                # Es una sílaba - agregar todas sus letras de una vez
+                logger.debug("Auto-agregando SÍLABA: %s", letter)
+                self.word_sentence_manager.add_word(letter)
             else:
                 # Es una letra individual
-                print(f"[DEBUG] Auto-agregando LETRA: {letter}")
+                logger.debug("Auto-agregando LETRA: %s", letter)
                 self.word_sentence_manager.add_letter(letter)
             
             # Actualizar display
             self.update_text_display()
-            self.status_var.set(f"✓ Auto-agregado: {letter}")
+            self._set_status(f"✓ Auto-agregado: {letter}")
             
             # Actualizar sugerencias
             if self.suggestions_enabled:
-                self.root.after(100, self.update_suggestions)
+                self._schedule_suggestions()
             
-            self.root.after(1000, lambda: self.status_var.set("🔴 Detectando gestos...") 
-                           if self.is_running else None)
+            self._schedule_status_reset(1000)
     
     def add_letter_to_word(self):
         """Agrega letra O SÍLABA manualmente - CORREGIDO"""
@@ -1731,13 +2253,12 @@ class MainWindow:
         if detected and detected != "-":
             # Verificar si es sílaba o letra
             if len(detected) > 1:
-                # Es una sílaba - agregar cada letra
-                print(f"[DEBUG] Agregando manualmente SÍLABA: {detected}")
-                for char in detected:
-                    self.word_sentence_manager.add_letter(char)
+                # Es una sílaba - agregar todas sus letras de una vez
+                logger.debug("Agregando manualmente SÍLABA: %s", detected)
+                self.word_sentence_manager.add_word(detected)
             else:
                 # Es una letra individual
-                print(f"[DEBUG] Agregando manualmente LETRA: {detected}")
+                logger.debug("Agregando manualmente LETRA: %s", detected)
                 self.word_sentence_manager.add_letter(detected)
             
             # Actualizar display
@@ -1745,7 +2266,7 @@ class MainWindow:
             
             # Actualizar sugerencias
             if self.suggestions_enabled:
-                self.root.after(100, self.update_suggestions)
+                self._schedule_suggestions()
     
     def add_space(self):
         """Agrega espacio (confirma palabra)"""
@@ -1758,73 +2279,95 @@ class MainWindow:
         """Actualiza la visualización de palabra actual y oración"""
         try:
             current_word = self.word_sentence_manager.get_current_word()
-            self.current_word_text.delete(1.0, tk.END)
-            if current_word:
-                self.current_word_text.insert(1.0, current_word)
+            word_changed = current_word != self._last_current_word
+            if word_changed:
+                self._last_current_word = current_word
+                self.current_word_text.replace(1.0, tk.END, current_word)
             
             sentence = self.word_sentence_manager.get_complete_sentence()
-            self.sentence_text.delete(1.0, tk.END)
-            if sentence:
-                self.sentence_text.insert(1.0, sentence)
-            
-            stats = self.word_sentence_manager.get_statistics()
-            word_count = stats['sentence_word_count']
-            self.word_count_label.config(text=f"{word_count} palabras")
+            if sentence != self._last_sentence:
+                self._last_sentence = sentence
+                self.sentence_text.replace(1.0, tk.END, sentence)
+                
+                word_count = self.word_sentence_manager.sentence_word_count
+                if word_count != self._last_word_count:
+                    self._last_word_count = word_count
+                    self.word_count_label.config(text=f"{word_count} palabras")
             
-            if current_word and len(current_word) >= 2:
-                self.current_suggestions = self.word_suggester.update_current_word(current_word)
-                self.update_suggestion_buttons()
-            elif not current_word:
-                self.current_suggestions = []
-                self.update_suggestion_buttons()
+            # Las sugerencias dependen solo de la palabra actual: si no cambió
+            # (p. ej. deshacer que restaura la misma palabra) no hay nada que recalcular
+            if word_changed:
+                if current_word and len(current_word) >= 2:
+                    self._schedule_suggestions()
+                elif not current_word:
+                    self.current_suggestions = []
+                    self.update_suggestion_buttons()
             
         except Exception as e:
-            print(f"Error actualizando display: {e}")
+            logger.error("Error actualizando display: %s", e)
     
     def confirm_word(self):
         """Confirma la palabra actual"""
         if self.word_sentence_manager.add_space():
             self.update_text_display()
-            self.status_var.set("✓ Palabra agregada a la oración")
+            self._set_status("✓ Palabra agregada a la oración")
             self.current_suggestions = []
             self.update_suggestion_buttons()
         else:
-            self.status_var.set("⚠ No hay palabra para agregar")
+            self._set_status("⚠ No hay palabra para agregar")
     
     def undo_last_word(self):
         """Deshace la última palabra agregada"""
         if self.word_sentence_manager.undo_last_word():
             self.update_text_display()
-            self.status_var.set("↶ Última palabra deshecha")
+            self._set_status("↶ Última palabra deshecha")
         else:
-            self.status_var.set("⚠ No hay nada para deshacer")
+            self._set_status("⚠ No hay nada para deshacer")
     
     def clear_text(self):
         """Limpia todo el texto"""
         self.word_sentence_manager.clear_all()
         self.update_text_display()
-        self.letter_var.set("-")
+        self._mark_ui('letter', "-")
         self.detected_letter = ""
         self.detected_syllable = ""
         self.current_suggestions = []
         self.update_suggestion_buttons()
-        self.status_var.set("✓ Texto limpiado")
+        self._set_status("✓ Texto limpiado")
     
     def speak_text(self):
         """Reproduce el texto completo usando TTS"""
         text = self.word_sentence_manager.finalize_sentence()
         if text:
-            self.audio_manager.speak(text)
-            self.status_var.set(f"🔊 Reproduciendo: {text}")
+            # Descartar la reproducción pendiente para no acumular clics repetidos
+            if self._tts_future is not None:
+                self._tts_future.cancel()
+            self._tts_future = self._tts_executor.submit(
+                self.audio_manager.speak, text, False
+            )
+            self._set_status(f"🔊 Reproduciendo: {text}")
             self.update_text_display()
         else:
             messagebox.showinfo("Información", "No hay texto para reproducir")
     
     def on_closing(self):
         self.stop_detection()
+        for thread in (self._capture_thread, self._detection_thread):
+            if thread is not None and thread.is_alive():
+                thread.join(timeout=1.0)
+        # Callbacks diferidos pendientes: no deben correr sobre widgets destruidos.
+        # Se cancelan tras detener los hilos, que ya no pueden agendar otros
+        for attr in ('_text_change_after_id', '_suggest_after_id',
+                     '_status_reset_id', '_control_feedback_after_id',
+                     '_complete_word_reset_id', '_ui_flush_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+                setattr(self, attr, None)
         if self.cap:
             self.cap.release()
         self.audio_manager.stop()
+        self._tts_executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
     
     def run(self):
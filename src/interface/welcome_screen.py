@@ -127,18 +127,9 @@ Características:
             cursor='hand2',
             command=self.start_application
         )
+        # El efecto hover lo hace Tk con activebackground, sin callbacks
         start_button.pack()
         
-        # Efecto hover para el botón
-        def on_enter(e):
-            start_button.config(bg='#2980B9')
-        
-        def on_leave(e):
-            start_button.config(bg='#3498DB')
-        
-        start_button.bind("<Enter>", on_enter)
-        start_button.bind("<Leave>", on_leave)
-        
         # Frame inferior
         info_frame = tk.Frame(main_frame, bg='#34495E')
         info_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(20, 0))
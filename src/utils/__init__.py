@@ -2,11 +2,25 @@
 Módulo de utilidades
 """
 
-from .audio_manager import AudioManager
-from .data_processor import DataProcessor
-from .word_dictionary import WordDictionary
-from .word_suggester import WordSuggester
-from .sentence_bank import SentenceBank
-from .word_sentence_manager import WordSentenceManager
-
-__all__ = ['AudioManager', 'DataProcessor', 'WordDictionary', 'WordSuggester', 'SentenceBank', 'WordSentenceManager']
\ No newline at end of file
+import importlib
+
+# Los submódulos se importan al primer acceso: AudioManager carga pyttsx3,
+# que no hace falta para usar el diccionario o el banco de oraciones
+_LAZY_IMPORTS = {
+    'AudioManager': '.audio_manager',
+    'DataProcessor': '.data_processor',
+    'WordDictionary': '.word_dictionary',
+    'WordSuggester': '.word_suggester',
+    'SentenceBank': '.sentence_bank',
+    'WordSentenceManager': '.word_sentence_manager',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['AudioManager', 'DataProcessor', 'WordDictionary', 'WordSuggester', 'SentenceBank', 'WordSentenceManager']
@@ -3,6 +3,12 @@
 Diccionario de palabras comunes en español para el traductor de señas
 """
 
+from bisect import bisect_left, insort
+
+# Mayor carácter posible: prefijo + _MAX_CHAR acota por arriba el bloque del prefijo
+_MAX_CHAR = '\U0010ffff'
+
+
 class WordDictionary:
     def __init__(self):
         # Palabras organizadas por categorías
@@ -60,6 +66,9 @@ class WordDictionary:
         # Eliminar duplicados y ordenar
         self.all_words = sorted(list(set(self.all_words)))
         
+        # Conjunto para búsquedas de pertenencia en O(1)
+        self._word_set = set(self.all_words)
+        
         # Frases completas comunes
         self.common_phrases = [
             'HOLA COMO ESTAS',
@@ -140,9 +149,12 @@ class WordDictionary:
         
         prefix = prefix.upper().strip()
         
-        # Buscar palabras que empiezan con el prefijo
-        matches = [word for word in self.all_words 
-                  if word.startswith(prefix)]
+        # La lista está ordenada: las palabras con el prefijo forman un
+        # bloque contiguo; ambos extremos se ubican por bisección, así la
+        # búsqueda no depende del tamaño del diccionario
+        start = bisect_left(self.all_words, prefix)
+        end = bisect_left(self.all_words, prefix + _MAX_CHAR, start)
+        matches = self.all_words[start:end]
         
         # Ordenar por longitud (palabras más cortas primero)
         matches.sort(key=len)
@@ -164,7 +176,7 @@ class WordDictionary:
     
     def is_valid_word(self, word):
         """Verifica si una palabra está en el diccionario"""
-        return word.upper().strip() in self.all_words
+        return word.upper().strip() in self._word_set
     
     def get_word_frequency(self, word):
         """
@@ -199,7 +211,7 @@ class WordDictionary:
         word = word.upper().strip()
         
         # Si la palabra está correcta, retornar vacío
-        if word in self.all_words:
+        if word in self._word_set:
             return []
         
         similar = []
@@ -247,9 +259,9 @@ class WordDictionary:
         """Agrega una palabra personalizada al diccionario"""
         word = word.upper().strip()
         
-        if word and word not in self.all_words:
-            self.all_words.append(word)
-            self.all_words.sort()
+        if word and word not in self._word_set:
+            insort(self.all_words, word)
+            self._word_set.add(word)
             
             if category not in self.categories:
                 self.categories[category] = []
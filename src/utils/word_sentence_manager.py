@@ -3,6 +3,11 @@
 Gestor que separa la palabra actual de la oración completa
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
+
 class WordSentenceManager:
     def __init__(self):
         # Palabra que se está escribiendo ahora
@@ -20,6 +25,10 @@ class WordSentenceManager:
         # Buffer temporal para manejar gestos
         self.gesture_buffer = ""
         
+        # Conteo de palabras de la última oración contada
+        self._counted_sentence = ""
+        self._sentence_word_count = 0
+        
     def add_letter(self, letter):
         """
         Agrega una letra a la palabra actual
@@ -31,6 +40,49 @@ class WordSentenceManager:
             return True
         return False
     
+    def add_word(self, word):
+        """
+        Agrega varias letras a la palabra actual en una sola operación,
+        con las mismas reglas que add_letter
+        """
+        letters = self._clean_letters(word)
+        if not letters:
+            return False
+        
+        self.current_word += letters
+        self.gesture_buffer = ""
+        return True
+    
+    def append_words(self, words):
+        """
+        Confirma varias palabras y las agrega a la oración en una sola
+        operación, como si cada una se escribiera y se confirmara con espacio
+        """
+        confirmed = []
+        for word in words:
+            letters = self._clean_letters(word)
+            if letters:
+                self._remember_word(letters)
+                confirmed.append(letters)
+        
+        if not confirmed:
+            return False
+        
+        self._append_to_sentence(confirmed)
+        return True
+    
+    @staticmethod
+    def _clean_letters(word):
+        """
+        Filtra una palabra con las reglas de add_letter (mayúsculas, un carácter)
+        """
+        letters = []
+        for char in word:
+            letter = char.upper().strip()
+            if letter and len(letter) == 1:
+                letters.append(letter)
+        return ''.join(letters)
+    
     def add_gesture_to_buffer(self, gesture):
         """
         Agrega un gesto al buffer temporal (para palabras completas por gesto)
@@ -67,22 +119,33 @@ class WordSentenceManager:
         """
         if self.current_word:
             # Agregar palabra al historial
-            if self.current_word not in self.word_history:
-                self.word_history.insert(0, self.current_word)
-                # Mantener solo las últimas 10 palabras
-                self.word_history = self.word_history[:10]
+            self._remember_word(self.current_word)
             
             # Agregar palabra a la oración
-            if self.complete_sentence:
-                self.complete_sentence += " " + self.current_word
-            else:
-                self.complete_sentence = self.current_word
+            self._append_to_sentence([self.current_word])
             
             # Limpiar palabra actual
             self.current_word = ""
             return True
         return False
     
+    def _remember_word(self, word):
+        """
+        Agrega una palabra confirmada al historial (últimas 10, sin repetir)
+        """
+        if word not in self.word_history:
+            self.word_history.insert(0, word)
+            self.word_history = self.word_history[:10]
+    
+    def _append_to_sentence(self, words):
+        """
+        Agrega palabras confirmadas a la oración con una sola concatenación
+        """
+        if self.complete_sentence:
+            self.complete_sentence = " ".join([self.complete_sentence, *words])
+        else:
+            self.complete_sentence = " ".join(words)
+    
     def add_complete_sentence(self, text: str) -> bool:
         """
         Agrega una oración o palabra completa directamente
@@ -104,33 +167,14 @@ class WordSentenceManager:
             # Limpiar palabra actual si existe
             self.clear_current_word()
             
-            # Verificar si es una sola palabra o múltiples
+            # Una o varias palabras: se confirman y se agregan de una vez
             words = text.split()
+            self.append_words(words)
             
             if len(words) == 1:
-                # Es una sola palabra - agregarla como palabra actual y confirmar
-                word = words[0]
-                
-                # Agregar letra por letra
-                for letter in word:
-                    self.add_letter(letter)
-                
-                # Confirmar la palabra (agregar espacio)
-                self.add_space()
-                
-                print(f"[DEBUG WordSentenceManager] Palabra única agregada: {word}")
-                
+                logger.debug("Palabra única agregada: %s", words[0])
             else:
-                # Son múltiples palabras - agregar cada una
-                for word in words:
-                    # Agregar letra por letra
-                    for letter in word:
-                        self.add_letter(letter)
-                    
-                    # Confirmar la palabra
-                    self.add_space()
-                
-                print(f"[DEBUG WordSentenceManager] Oración completa agregada: {text}")
+                logger.debug("Oración completa agregada: %s", text)
             
             # Agregar al historial de oraciones si no es una palabra muy corta
             if len(text) > 3 and text not in self.sentence_history:
@@ -140,9 +184,7 @@ class WordSentenceManager:
             return True
             
         except Exception as e:
-            print(f"[ERROR WordSentenceManager] Error agregando texto completo: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error agregando texto completo: %s", e)
             return False
     
     def add_word_by_gesture(self, word: str) -> bool:
@@ -165,20 +207,19 @@ class WordSentenceManager:
             # Limpiar palabra actual
             self.clear_current_word()
             
-            # Agregar letra por letra a la palabra actual
-            for letter in word:
-                self.current_word += letter
+            # La palabra completa pasa a ser la palabra actual
+            self.current_word = word
             
             # Confirmar inmediatamente (agregar a oración completa)
             success = self.add_space()
             
             if success:
-                print(f"[DEBUG WordSentenceManager] Palabra por gesto agregada: {word}")
+                logger.debug("Palabra por gesto agregada: %s", word)
             
             return success
             
         except Exception as e:
-            print(f"[ERROR WordSentenceManager] Error agregando palabra por gesto: {e}")
+            logger.error("Error agregando palabra por gesto: %s", e)
             return False
     
     def clear_current_word(self):
@@ -219,6 +260,16 @@ class WordSentenceManager:
         """
         return self.complete_sentence
     
+    @property
+    def sentence_word_count(self):
+        """
+        Número de palabras de la oración; solo se recuenta si la oración cambió
+        """
+        if self.complete_sentence is not self._counted_sentence:
+            self._counted_sentence = self.complete_sentence
+            self._sentence_word_count = len(self.complete_sentence.split())
+        return self._sentence_word_count
+    
     def get_full_text(self):
         """
         Retorna el texto completo (oración + palabra actual)
@@ -264,7 +315,7 @@ class WordSentenceManager:
         return {
             'current_word_length': len(self.current_word),
             'sentence_length': len(self.complete_sentence),
-            'sentence_word_count': len(self.complete_sentence.split()) if self.complete_sentence else 0,
+            'sentence_word_count': self.sentence_word_count,
             'total_words_used': len(self.word_history),
             'total_sentences_used': len(self.sentence_history)
         }
@@ -3,6 +3,7 @@
 Sistema inteligente de sugerencias de palabras
 """
 
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
 from .word_dictionary import WordDictionary
 
@@ -18,6 +19,9 @@ class WordSuggester:
         self.auto_suggest_enabled = True
         self.min_letters_for_suggest = 2
         
+        # Caché de sugerencias por prefijo (se invalida si cambia el diccionario)
+        self._cached_suggestions = lru_cache(maxsize=1024)(self._compute_suggestions)
+        
     def update_current_word(self, text: str) -> List[str]:
         """
         Actualiza la palabra actual y genera sugerencias
@@ -51,20 +55,26 @@ class WordSuggester:
         if not self.current_word:
             return []
         
+        return list(self._cached_suggestions(self.current_word))
+    
+    def _compute_suggestions(self, prefix: str) -> Tuple[str, ...]:
+        """
+        Calcula las sugerencias para un prefijo (resultado inmutable para la caché)
+        """
         suggestions = []
         
         # 1. Buscar palabras que empiezan con el prefijo
         prefix_matches = self.dictionary.search_words(
-            self.current_word, 
+            prefix, 
             max_results=self.max_suggestions
         )
         suggestions.extend(prefix_matches)
         
         # 2. Si la palabra es corta y no hay coincidencias exactas,
         #    buscar palabras similares
-        if len(suggestions) < self.max_suggestions and len(self.current_word) >= 3:
+        if len(suggestions) < self.max_suggestions and len(prefix) >= 3:
             similar = self.dictionary.get_similar_words(
-                self.current_word, 
+                prefix, 
                 max_results=self.max_suggestions - len(suggestions)
             )
             
@@ -74,7 +84,7 @@ class WordSuggester:
                     suggestions.append(word)
         
         # 3. Verificar si hay corrección ortográfica sugerida
-        correction = self.dictionary.suggest_correction(self.current_word)
+        correction = self.dictionary.suggest_correction(prefix)
         if correction and correction not in suggestions:
             # Agregar al inicio si es una corrección
             suggestions.insert(0, correction)
@@ -85,7 +95,20 @@ class WordSuggester:
             reverse=True
         )
         
-        return suggestions[:self.max_suggestions]
+        return tuple(suggestions[:self.max_suggestions])
+    
+    def add_custom_word(self, word: str, category: str = 'custom') -> bool:
+        """
+        Agrega una palabra al diccionario e invalida la caché de sugerencias
+        """
+        added = self.dictionary.add_custom_word(word, category)
+        if added:
+            self.clear_cache()
+        return added
+    
+    def clear_cache(self):
+        """Vacía la caché de sugerencias por prefijo"""
+        self._cached_suggestions.cache_clear()
     
     def get_quick_suggestions(self) -> List[str]:
         """
@@ -1,4 +1,5 @@
 from .test_detector import TestDetector
 from .test_interface import TestInterface
+from .test_utils import TestWordDictionary, TestWordSentenceManager
 
-__all__ = ['TestDetector', 'TestInterface']
+__all__ = ['TestDetector', 'TestInterface', 'TestWordDictionary', 'TestWordSentenceManager']
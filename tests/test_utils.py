@@ -0,0 +1,76 @@
+# tests/test_utils.py
+
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.word_dictionary import WordDictionary
+from utils.word_sentence_manager import WordSentenceManager
+
+class TestWordDictionary(unittest.TestCase):
+    def setUp(self):
+        self.dictionary = WordDictionary()
+    
+    def test_search_words_prefix(self):
+        """Test de búsqueda por prefijo"""
+        expected = sorted(
+            (w for w in self.dictionary.get_all_words() if w.startswith('CA')),
+            key=len
+        )[:5]
+        self.assertEqual(self.dictionary.search_words('ca'), expected)
+    
+    def test_search_words_custom_word(self):
+        """Test de búsqueda con palabra personalizada"""
+        self.assertTrue(self.dictionary.add_custom_word('zzprueba'))
+        self.assertIn('ZZPRUEBA', self.dictionary.search_words('ZZ'))
+        self.assertTrue(self.dictionary.is_valid_word('zzprueba'))
+
+class TestWordSentenceManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = WordSentenceManager()
+    
+    def test_add_word_matches_add_letter(self):
+        """Test de que add_word equivale a agregar letra por letra"""
+        expected = WordSentenceManager()
+        for letter in 'hola ñu':
+            expected.add_letter(letter)
+        
+        self.assertTrue(self.manager.add_word('hola ñu'))
+        self.assertEqual(self.manager.get_current_word(), expected.get_current_word())
+    
+    def test_add_complete_sentence(self):
+        """Test de oración de varias palabras agregada de una vez"""
+        self.manager.add_word('hola')
+        self.manager.add_space()
+        self.assertTrue(self.manager.add_complete_sentence('como estas'))
+        self.assertEqual(self.manager.get_complete_sentence(), 'HOLA COMO ESTAS')
+        self.assertEqual(self.manager.get_current_word(), '')
+        self.assertEqual(self.manager.get_word_history()[:3], ['ESTAS', 'COMO', 'HOLA'])
+    
+    def test_append_words(self):
+        """Test de palabras confirmadas en bloque"""
+        self.manager.add_word('ya')
+        self.assertTrue(self.manager.append_words(['hola', 'amigo']))
+        self.assertEqual(self.manager.get_complete_sentence(), 'HOLA AMIGO')
+        self.assertEqual(self.manager.get_current_word(), 'YA')
+        self.assertFalse(self.manager.append_words(['  ']))
+    
+    def test_sentence_word_count(self):
+        """Test del conteo de palabras de la oración"""
+        self.assertEqual(self.manager.sentence_word_count, 0)
+        self.manager.append_words(['hola', 'como', 'estas'])
+        self.assertEqual(self.manager.sentence_word_count, 3)
+        self.manager.undo_last_word()
+        self.assertEqual(self.manager.sentence_word_count, 2)
+        self.assertEqual(self.manager.get_statistics()['sentence_word_count'], 2)
+    
+    def test_add_word_empty(self):
+        """Test de palabra sin letras válidas"""
+        self.assertFalse(self.manager.add_word('  '))
+        self.assertEqual(self.manager.get_current_word(), '')
+
+if __name__ == '__main__':
+    unittest.main()